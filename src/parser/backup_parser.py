@@ -23,7 +23,13 @@ import plistlib
 import sqlite3
 import os
 import re
-from datetime import datetime, timedelta
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+from tzlocal import get_localzone
 import pandas as pd
 from hashlib import sha1
 import time
@@ -108,10 +114,11 @@ def save_report_with_device_info(df, csv_path, device_info, report_title, timezo
     
     # Convert timestamps in the DataFrame if timezone specified
     if timezone:
+        convert = make_converter(timezone)
         for column in df.columns:
             if 'date' in column.lower() or 'time' in column.lower():
                 df[column] = df[column].apply(
-                    lambda x: convert_timezone(x, timezone) if x and 'UTC' in str(x) else x
+                    lambda x: convert(x) if x and 'UTC' in str(x) else x
                 )
     
     # Write header to file
@@ -163,6 +170,36 @@ def photo_taxonomy(photosqlitepath):        # query photo db to get scene descri
     conn.close()
     return(df)
 
+def _start_artifact_queries(artifact_dir, artifacts):
+    """
+    Start the SQLite query for every recognised artifact on a thread pool.
+    sqlite3 releases the GIL while a query runs, so the databases are read in parallel.
+    
+    Returns:
+        dict: (artifact, query function) -> Future of the query's result
+    """
+    queries = (
+        (("3d0d7e5fb2ce288813306e4d4636395e047a3d28", "sms.db"), parse_ios_backup.sqlite_run_SMS),
+        (("5a4935c78a5255723f707230a451d79c540d2741", "CallHistory.storedata"), parse_ios_backup.sqlite_run_callhistory),
+        (("31bb7ba8914766d4ba40d6dfb6113c8b614be442", "AddressBook.sqlitedb"), parse_ios_backup.sqlite_run_addressbook),
+        (("0d609c54856a9bb2d56729df1d68f2958a88426b", "DataUsage.sqlite"), parse_ios_backup.sqlite_run_datausage),
+        (("943624fd13e27b800cc6d9ce1100c22356ee365c", "Accounts3.sqlite"), parse_ios_backup.sqlite_run_accounts3),
+        (("ed1f8fb5a948b40504c19580a458c384659a605e", "notes.sqlite"), parse_ios_backup.sqlite_run_notes),
+        (("64d0019cb3d46bfc8cce545a8ba54b93e7ea9347", "TCC.db"), parse_ios_backup.sqlite_run_TCC),
+        (("History.db",), parse_ios_backup.sqlite_run_safarihistory),
+        (("interactionC.db",), parse_ios_backup.sqlite_run_interactionC),
+    )
+    
+    pool = ThreadPoolExecutor(max_workers=min(len(queries), (os.cpu_count() or 1) + 2))
+    futures = {}
+    for artifact in artifacts:
+        file_path = os.path.join(artifact_dir, artifact)
+        for markers, query in queries:
+            if any(marker in artifact for marker in markers):
+                futures[(artifact, query)] = pool.submit(query, file_path)
+    pool.shutdown(wait=False)  # Queued queries still run; results are collected in order
+    return futures
+
 def parse_backup(backup_path, password, status_callback=None, output_dir=None, taxonomy_target=None, timezone=None):
     """
     Parse an iOS backup and return structured data
@@ -329,6 +366,16 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
         if status_callback:
             status_callback(f"Found {len(recovered_files)} files to process")
     
+    # Read the databases in parallel; the loop below collects each result in turn
+    query_futures = _start_artifact_queries(file_output_destination, recovered_files)
+    
+    def run_query(query, artifact):
+        """Return the prefetched result of query for artifact, re-raising its error"""
+        future = query_futures.get((artifact, query))
+        if future is None:
+            return query(os.path.join(file_output_destination, artifact))
+        return future.result()
+    
     # Single loop for processing all files
     for artifact in recovered_files:
         file_path = os.path.join(file_output_destination, artifact)
@@ -341,7 +388,7 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
             if status_callback:
                 status_callback("Processing SMS messages...")
             try:
-                sms_data, sms_df = parse_ios_backup.sqlite_run_SMS(file_path)
+                sms_data, sms_df = run_query(parse_ios_backup.sqlite_run_SMS, artifact)
                 if len(sms_data) > 1:  # Skip header row
                     # Save to CSV
                     csv_path = os.path.join(reports_dir, f'Messages_{datetime.now().strftime("%Y%m%d%H%M%S")}.csv')
@@ -378,7 +425,7 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
             if status_callback:
                 status_callback("Processing call history...")
             try:
-                call_data = parse_ios_backup.sqlite_run_callhistory(file_path)
+                call_data = run_query(parse_ios_backup.sqlite_run_callhistory, artifact)
                 if len(call_data) > 1:  # Skip header row
                     # Save to CSV
                     csv_path = os.path.join(reports_dir, f'Call_History_{datetime.now().strftime("%Y%m%d%H%M%S")}.csv')
@@ -413,7 +460,7 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
             if status_callback:
                 status_callback("Processing contacts...")
             try:
-                contact_data = parse_ios_backup.sqlite_run_addressbook(file_path)
+                contact_data = run_query(parse_ios_backup.sqlite_run_addressbook, artifact)
                 if len(contact_data) > 1:  # Skip header row
                     # Save to CSV
                     csv_path = os.path.join(reports_dir, f'Contacts_{datetime.now().strftime("%Y%m%d%H%M%S")}.csv')
@@ -448,7 +495,7 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
             if status_callback:
                 status_callback("Processing data usage...")
             try:
-                data_usage = parse_ios_backup.sqlite_run_datausage(file_path)
+                data_usage = run_query(parse_ios_backup.sqlite_run_datausage, artifact)
                 if len(data_usage) > 1:  # Skip header row
                     # Save to CSV
                     csv_path = os.path.join(reports_dir, f'Data_Usage_{datetime.now().strftime("%Y%m%d%H%M%S")}.csv')
@@ -482,7 +529,7 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
             if status_callback:
                 status_callback("Processing accounts...")
             try:
-                accounts_data = parse_ios_backup.sqlite_run_accounts3(file_path)
+                accounts_data = run_query(parse_ios_backup.sqlite_run_accounts3, artifact)
                 if len(accounts_data) > 1:  # Skip header row
                     # Save to CSV
                     csv_path = os.path.join(reports_dir, f'Accounts_{datetime.now().strftime("%Y%m%d%H%M%S")}.csv')
@@ -516,7 +563,7 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
                 status_callback("Processing notes...")
             try:
                 print("Processing notes...")
-                notes_data = parse_ios_backup.sqlite_run_notes(file_path)
+                notes_data = run_query(parse_ios_backup.sqlite_run_notes, artifact)
                 # print(f"Notes data: {notes_data}")
                 if notes_data and len(notes_data) > 1:  # Skip header row
                     # Save to CSV
@@ -548,7 +595,7 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
             if status_callback:
                 status_callback("Processing app permissions...")
             try:
-                permissions_data = parse_ios_backup.sqlite_run_TCC(file_path)
+                permissions_data = run_query(parse_ios_backup.sqlite_run_TCC, artifact)
                 if permissions_data and len(permissions_data) > 1:  # Skip header row
                     # Save to CSV
                     csv_path = os.path.join(reports_dir, f'App_Permissions_{datetime.now().strftime("%Y%m%d%H%M%S")}.csv')
@@ -580,7 +627,7 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
             if status_callback:
                 status_callback("Processing Safari browsing history...")
             try:
-                safari_data = parse_ios_backup.sqlite_run_safarihistory(file_path)
+                safari_data = run_query(parse_ios_backup.sqlite_run_safarihistory, artifact)
                 if safari_data and len(safari_data) > 1:  # Skip header row
                     # Save to CSV
                     csv_path = os.path.join(reports_dir, f'Safari_History_{datetime.now().strftime("%Y%m%d%H%M%S")}.csv')
@@ -611,7 +658,7 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
             if status_callback:
                 status_callback("Processing interaction data...")
             try:
-                interaction_data = parse_ios_backup.sqlite_run_interactionC(file_path)
+                interaction_data = run_query(parse_ios_backup.sqlite_run_interactionC, artifact)
                 # print(f"Interaction data: {interaction_data}")
                 if interaction_data and len(interaction_data) > 1:
                     csv_path = os.path.join(reports_dir, f'InteractionC_{datetime.now().strftime("%Y%m%d%H%M%S")}.csv')
@@ -760,10 +807,11 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
         
         # Convert timestamps in the DataFrame if timezone specified
         if timezone:
+            convert = make_converter(timezone)
             for column in filtered_df.columns:
                 if 'date' in column.lower() or 'time' in column.lower():
                     filtered_df[column] = filtered_df[column].apply(
-                        lambda x: convert_timezone(x, timezone) if x and 'UTC' in str(x) else x
+                        lambda x: convert(x) if x and 'UTC' in str(x) else x
                     )
         
         # FIX: Create device_header before using it
@@ -798,6 +846,7 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
     
     # Convert timestamps if timezone specified
     if timezone:
+        convert = make_converter(timezone)
         for data_type, data_list in results.items():
             # Only process dictionary data types
             if (isinstance(data_list, list) and data_list and 
@@ -811,7 +860,7 @@ def parse_backup(backup_path, password, status_callback=None, output_dir=None, t
                 for item in data_list:
                     for field in date_fields:
                         if field in item and 'UTC' in str(item[field]):
-                            item[field] = convert_timezone(item[field], timezone)
+                            item[field] = convert(item[field])
     
     return results
 
@@ -1924,60 +1973,116 @@ def display_photos(self, photo_output_path):
     canvas.pack(side="left", fill="both", expand=True)
     scrollbar.pack(side="right", fill="y")
 
-def convert_timezone(timestamp_str, target_timezone):
-    """Convert a timestamp string from UTC to the target timezone"""
-    import datetime
-    import pytz
-    from tzlocal import get_localzone
+# Canonical "YYYY-MM-DD HH:MM:SS[ UTC]" form produced by mac_absolute_time_to_datetime
+_UTC_TIMESTAMP_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})(?: UTC)?")
+
+_UTC = dt_timezone.utc
+
+# Formats tried (in order) when the canonical form does not match
+_TIMESTAMP_FORMATS = (
+    "%Y-%m-%d %H:%M:%S UTC",  # Format with UTC suffix
+    "%Y-%m-%d %H:%M:%S",      # Format without timezone
+    "%Y-%m-%d %H:%M:%S.%f",   # Format with microseconds
+    "%Y-%m-%d",               # Date only format
+    "%m/%d/%Y %H:%M:%S",      # US format with time
+    "%Y-%m-%dT%H:%M:%S"       # ISO format
+)
+
+def _parse_utc_timestamp(timestamp_str):
+    """Parse a UTC timestamp string into an aware datetime, or None if unrecognised"""
+    # Fast path: read the integer fields straight from a precompiled regex
+    match = _UTC_TIMESTAMP_RE.fullmatch(timestamp_str)
+    if match:
+        try:
+            return datetime(*map(int, match.groups()), tzinfo=_UTC)
+        except ValueError:
+            pass
     
-    if not timestamp_str:
-        return timestamp_str
+    for fmt in _TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(timestamp_str, fmt).replace(tzinfo=_UTC)  # Assume UTC
+        except ValueError:
+            continue
+    return None
+
+@lru_cache(maxsize=None)
+def _resolve_timezone(name):
+    """Return the ZoneInfo for an IANA timezone name, cached per name"""
+    return ZoneInfo(name)
+
+# Zero-padded two digit strings indexed by value, used instead of strftime
+_TWO_DIGITS = [f"{i:02d}" for i in range(100)]
+
+def _format_timestamp(dt):
+    """Format an aware datetime as 'YYYY-MM-DD HH:MM:SS (TZ)'"""
+    return (f"{dt.year}-{_TWO_DIGITS[dt.month]}-{_TWO_DIGITS[dt.day]} "
+            f"{_TWO_DIGITS[dt.hour]}:{_TWO_DIGITS[dt.minute]}:{_TWO_DIGITS[dt.second]} "
+            f"({dt.tzname() or ''})")
+
+# Converted strings are interned and reused, since many rows share a timestamp
+_CONVERTED_CACHE_SIZE = 65536
+_converted_cache = OrderedDict()
+
+def make_converter(target_timezone):
+    """
+    Build a timestamp converter specialised for one target timezone.
     
-    try:
-        # Handle different timestamp formats
-        dt_utc = None
-        formats_to_try = [
-            "%Y-%m-%d %H:%M:%S UTC",  # Format with UTC suffix
-            "%Y-%m-%d %H:%M:%S",      # Format without timezone
-            "%Y-%m-%d %H:%M:%S.%f",   # Format with microseconds
-            "%Y-%m-%d",               # Date only format
-            "%m/%d/%Y %H:%M:%S",      # US format with time
-            "%Y-%m-%dT%H:%M:%S"       # ISO format
-        ]
+    The timezone is resolved once here, so the returned function does no
+    per-row branching or lookup on the timezone name. Callers converting a
+    whole report should build one converter and reuse it for every row.
+    
+    Args:
+        target_timezone (str): "UTC", an IANA name, or a "System Time (...)" label
+    
+    Returns:
+        callable: Function converting a UTC timestamp string for display
+    """
+    if target_timezone.startswith("System Time"):
+        target_tz = get_localzone()
+    elif target_timezone == "UTC":
+        target_tz = _UTC
+    else:
+        try:
+            target_tz = _resolve_timezone(target_timezone)
+        except Exception as e:
+            print(f"Error resolving timezone '{target_timezone}': {e}")
+            target_tz = None
+    is_utc = target_tz is _UTC
+    
+    def convert(timestamp_str):
+        """Convert a timestamp string from UTC to the bound timezone"""
+        if not timestamp_str or not isinstance(timestamp_str, str):
+            return timestamp_str
         
-        for fmt in formats_to_try:
-            try:
-                if "UTC" in fmt:
-                    dt_utc = datetime.datetime.strptime(timestamp_str.strip(), fmt)
-                    dt_utc = dt_utc.replace(tzinfo=pytz.UTC)
-                    break
-                else:
-                    # For formats without explicit timezone
-                    dt_utc = datetime.datetime.strptime(timestamp_str.strip(), fmt)
-                    dt_utc = dt_utc.replace(tzinfo=pytz.UTC)  # Assume UTC 
-                    break
-            except ValueError:
-                continue
+        key = (timestamp_str, target_timezone)
+        result = _converted_cache.get(key)
+        if result is not None:
+            _converted_cache.move_to_end(key)
+            return result
         
-        if not dt_utc:
-            return timestamp_str
-            
-        # Convert to selected timezone with consistent format
-        timezone_format = "%Y-%m-%d %H:%M:%S (%Z)"
+        result = timestamp_str
+        if target_tz is not None:
+            try:
+                # Only allocate a stripped copy when there is whitespace to remove
+                clean_str = timestamp_str
+                if clean_str[0].isspace() or clean_str[-1].isspace():
+                    clean_str = clean_str.strip()
+                dt_utc = _parse_utc_timestamp(clean_str)
+                if dt_utc:
+                    result = _format_timestamp(dt_utc if is_utc else dt_utc.astimezone(target_tz))
+            except Exception as e:
+                print(f"Error converting timestamp '{timestamp_str}': {e}")
         
-        if target_timezone.startswith("System Time"):
-            local_tz = get_localzone()
-            dt_local = dt_utc.astimezone(local_tz)
-            return dt_local.strftime(timezone_format)
-        elif target_timezone == "UTC":
-            # Use consistent format for UTC
-            return dt_utc.strftime(timezone_format)
-        else:
-            # Handle other timezone options
-            target_tz = pytz.timezone(target_timezone)
-            dt_target = dt_utc.astimezone(target_tz)
-            return dt_target.strftime(timezone_format)
-    except Exception as e:
-        print(f"Error converting timestamp '{timestamp_str}': {e}")
-        return timestamp_str
+        result = sys.intern(result)
+        _converted_cache[key] = result
+        if len(_converted_cache) > _CONVERTED_CACHE_SIZE:
+            _converted_cache.popitem(last=False)  # Evict least recently used
+        return result
+    
+    return convert
+
+_cached_converter = lru_cache(maxsize=32)(make_converter)
 
+def convert_timezone(timestamp_str, target_timezone):
+    """Convert a timestamp string from UTC to the target timezone"""
+    return _cached_converter(target_timezone)(timestamp_str)
@@ -24,62 +24,704 @@ import tkinter.ttk as ttk  # For Treeview widgets
 import customtkinter as ctk
 import threading
 import logging
+import time
+import traceback
+import queue
 from src.backup.device_backup import initiate_backup
 from src.parser.backup_parser import parse_backup, parse_ios_backup  # Import the class
-from PIL import Image, ImageTk  
+from PIL import Image, ImageTk, ExifTags
 import re
 import subprocess
 import platform
 from tzlocal import get_localzone
 from concurrent.futures import ThreadPoolExecutor
 import datetime
-import pytz
-import pillow_heif
-
-# Define GPS tags mapping
-GPSTAGS = {
-    0: "GPSVersionID",
-    1: "GPSLatitudeRef",
-    2: "GPSLatitude",
-    3: "GPSLongitudeRef",
-    4: "GPSLongitude",
-    5: "GPSAltitudeRef",
-    6: "GPSAltitude",
-    7: "GPSTimeStamp",
-    8: "GPSSatellites",
-    9: "GPSStatus",
-    10: "GPSMeasureMode",
-    11: "GPSDOP",
-    12: "GPSSpeedRef",
-    13: "GPSSpeed",
-    14: "GPSTrackRef",
-    15: "GPSTrack",
-    16: "GPSImgDirectionRef",
-    17: "GPSImgDirection",
-    18: "GPSMapDatum",
-    19: "GPSDestLatitudeRef",
-    20: "GPSDestLatitude",
-    21: "GPSDestLongitudeRef",
-    22: "GPSDestLongitude",
-    23: "GPSDestBearingRef",
-    24: "GPSDestBearing",
-    25: "GPSDestDistanceRef",
-    26: "GPSDestDistance",
-    27: "GPSProcessingMethod",
-    28: "GPSAreaInformation",
-    29: "GPSDateStamp",
-    30: "GPSDifferential"
-}
+import functools
+import hashlib
+import io
+import operator
+from bisect import bisect_right
+from zoneinfo import ZoneInfo
+import numpy as np
+import pandas as pd
+
+# Whether the pillow-heif opener has been registered with PIL yet
+_heif_registered = False
+
+def _register_heif_opener():
+    """Import pillow-heif and register its PIL opener on first use"""
+    global _heif_registered
+    if not _heif_registered:
+        import pillow_heif
+        pillow_heif.register_heif_opener()
+        _heif_registered = True
+
+def _open_with_system(path):
+    """Open a file or folder with the platform's default handler, without waiting on it"""
+    system = platform.system()
+    if system == 'Windows':
+        os.startfile(path)
+    elif system == 'Darwin':  # macOS
+        subprocess.Popen(['open', path])
+    else:  # Linux
+        subprocess.Popen(['xdg-open', path])
+
+# GPS tag names indexed by tag number (tags are contiguous from 0)
+GPSTAGS = (
+    "GPSVersionID",
+    "GPSLatitudeRef",
+    "GPSLatitude",
+    "GPSLongitudeRef",
+    "GPSLongitude",
+    "GPSAltitudeRef",
+    "GPSAltitude",
+    "GPSTimeStamp",
+    "GPSSatellites",
+    "GPSStatus",
+    "GPSMeasureMode",
+    "GPSDOP",
+    "GPSSpeedRef",
+    "GPSSpeed",
+    "GPSTrackRef",
+    "GPSTrack",
+    "GPSImgDirectionRef",
+    "GPSImgDirection",
+    "GPSMapDatum",
+    "GPSDestLatitudeRef",
+    "GPSDestLatitude",
+    "GPSDestLongitudeRef",
+    "GPSDestLongitude",
+    "GPSDestBearingRef",
+    "GPSDestBearing",
+    "GPSDestDistanceRef",
+    "GPSDestDistance",
+    "GPSProcessingMethod",
+    "GPSAreaInformation",
+    "GPSDateStamp",
+    "GPSDifferential",
+    "GPSHPositioningError"
+)
+
+def gps_tag(tag):
+    """Return the name of a numeric GPS tag, or the tag unchanged if unknown"""
+    if isinstance(tag, int) and 0 <= tag < len(GPSTAGS):
+        return GPSTAGS[tag]
+    return tag
+
+def _invert_rgb(pil_img):
+    """Return an RGBA copy of pil_img with RGB inverted and alpha preserved"""
+    arr = np.asarray(pil_img.convert("RGBA")).copy()
+    np.subtract(255, arr[..., :3], out=arr[..., :3])
+    return Image.fromarray(arr, "RGBA")
+
+def _load_inverted_icon(icon_path):
+    """Load the inverted icon, reusing a cached copy saved next to the source"""
+    cache_path = icon_path + ".inverted.png"
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(icon_path):
+        pil_img = Image.open(cache_path)
+        pil_img.load()
+        return pil_img
+    
+    # Inverse the image colors for dark mode (alpha preserved)
+    pil_img = _invert_rgb(Image.open(icon_path))
+    try:
+        pil_img.save(cache_path, "PNG", optimize=True)
+    except OSError as e:
+        print(f"Could not cache inverted icon: {e}")
+    return pil_img
 
 # Configure CustomTkinter appearance
 ctk.set_appearance_mode("System")  # Modes: "System" (standard), "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
 
+# Reference instant (naive UTC) used for every dropdown offset
+_NOW = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+def _get_utc_offset(timezone_str):
+    """Return the current UTC offset of a timezone formatted as '+HH:MM'"""
+    if timezone_str == "UTC":
+        return "+00:00"
+    
+    try:
+        seconds = int(ZoneInfo(timezone_str).utcoffset(_NOW).total_seconds())
+        sign = "+" if seconds >= 0 else "-"
+        seconds = abs(seconds)
+        # Format as '+02:00' or '-05:00'
+        return f"{sign}{seconds // 3600:02d}:{(seconds % 3600) // 60:02d}"
+    except:
+        return ""
+
+def _build_timezone_options():
+    """Build the timezone dropdown labels, each suffixed with its UTC offset"""
+    # Default options - system timezone and UTC
+    system_tz = get_localzone()
+    system_offset = _get_utc_offset(str(system_tz))
+    timezone_options = [
+        (f"System Time ({system_tz})", system_offset),
+        ("UTC", "+00:00"),
+        ("America/Hawaii", _get_utc_offset("Pacific/Honolulu")),       # -10:00
+        ("America/Alaska", _get_utc_offset("America/Anchorage")),      # -09:00
+        ("America/Pacific", _get_utc_offset("America/Los_Angeles")),   # -08:00 or -07:00
+        ("America/Mountain", _get_utc_offset("America/Denver")),       # -07:00 or -06:00
+        ("America/Central", _get_utc_offset("America/Chicago")),       # -06:00 or -05:00
+        ("America/Eastern", _get_utc_offset("America/New_York")),      # -05:00 or -04:00
+        ("America/Bogota", _get_utc_offset("America/Bogota")),         # -05:00
+        ("America/Toronto", _get_utc_offset("America/Toronto")),       # -05:00 or -04:00
+        ("America/Lima", _get_utc_offset("America/Lima")),             # -05:00
+        ("America/Santiago", _get_utc_offset("America/Santiago")),     # -04:00 or -03:00
+        ("America/Sao_Paulo", _get_utc_offset("America/Sao_Paulo")),   # -03:00
+        ("America/Buenos_Aires", _get_utc_offset("America/Argentina/Buenos_Aires")), # -03:00
+        ("Europe/Reykjavik", _get_utc_offset("Atlantic/Reykjavik")),   # +00:00
+        ("Europe/London", _get_utc_offset("Europe/London")),           # +00:00 or +01:00
+        ("Europe/Berlin", _get_utc_offset("Europe/Berlin")),           # +01:00 or +02:00
+        ("Europe/Paris", _get_utc_offset("Europe/Paris")),             # +01:00 or +02:00
+        ("Europe/Madrid", _get_utc_offset("Europe/Madrid")),           # +01:00 or +02:00
+        ("Europe/Rome", _get_utc_offset("Europe/Rome")),               # +01:00 or +02:00
+        ("Europe/Amsterdam", _get_utc_offset("Europe/Amsterdam")),     # +01:00 or +02:00
+        ("Europe/Zurich", _get_utc_offset("Europe/Zurich")),           # +01:00 or +02:00
+        ("Europe/Kyiv", _get_utc_offset("Europe/Kiev")),               # +02:00 or +03:00
+        ("Africa/Lagos", _get_utc_offset("Africa/Lagos")),             # +01:00
+        ("Africa/Cairo", _get_utc_offset("Africa/Cairo")),             # +02:00
+        ("Africa/Johannesburg", _get_utc_offset("Africa/Johannesburg")), # +02:00
+        ("Africa/Nairobi", _get_utc_offset("Africa/Nairobi")),         # +03:00
+        ("Europe/Moscow", _get_utc_offset("Europe/Moscow")),           # +03:00
+        ("Asia/Dubai", _get_utc_offset("Asia/Dubai")),                 # +04:00
+        ("Asia/Kolkata", _get_utc_offset("Asia/Kolkata")),             # +05:30
+        ("Asia/Bangkok", _get_utc_offset("Asia/Bangkok")),             # +07:00
+        ("Asia/Singapore", _get_utc_offset("Asia/Singapore")),         # +08:00
+        ("Asia/Hong_Kong", _get_utc_offset("Asia/Hong_Kong")),         # +08:00
+        ("Asia/Shanghai", _get_utc_offset("Asia/Shanghai")),           # +08:00
+        ("Asia/Seoul", _get_utc_offset("Asia/Seoul")),                 # +09:00
+        ("Asia/Tokyo", _get_utc_offset("Asia/Tokyo")),                 # +09:00
+        ("Australia/Perth", _get_utc_offset("Australia/Perth")),       # +08:00
+        ("Australia/Sydney", _get_utc_offset("Australia/Sydney")),     # +10:00 or +11:00
+        ("Australia/Melbourne", _get_utc_offset("Australia/Melbourne")), # +10:00 or +11:00
+        ("Pacific/Auckland", _get_utc_offset("Pacific/Auckland"))    # +12:00 or +13:00
+    ]
+    return [f"{name} {offset}" for name, offset in timezone_options]
+
+# Computed once at import rather than on every parse tab build
+_TIMEZONE_OPTIONS = _build_timezone_options()
+
+# Datasets whose rows show converted timestamps
+_TIMESTAMP_DATASETS = ("sms", "calls", "safari", "data_usage", "accounts", "notes", "photos", "interactions")
+
+def _is_timestamp_key(key):
+    """Return True for record keys that may hold a displayed timestamp"""
+    key = str(key).lower()
+    return 'date' in key or 'time' in key or key in ('event start', 'event end')
+
+# Fields of a "YYYY-MM-DD HH:MM:SS" timestamp
+_DISPLAY_TIMESTAMP_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2}) (\d{1,2}):(\d{1,2}):(\d{1,2})")
+
+# "YYYY-MM-DD HH:MM:SS (TZ)", built without strftime's per-call %Z handling
+_DISPLAY_FORMAT = "%04d-%02d-%02d %02d:%02d:%02d (%s)"
+
+@functools.lru_cache(maxsize=None)
+def _get_tz(timezone_preference):
+    """Resolve a timezone preference to a tzinfo, cached per preference"""
+    if timezone_preference.startswith("System Time"):
+        return get_localzone()
+    elif timezone_preference == "UTC":
+        return datetime.timezone.utc  # Always show (UTC)
+    return ZoneInfo(timezone_preference)
+
+def _convert_display_timestamp(timestamp_str, timezone_preference):
+    """Convert a UTC timestamp string for display in the given timezone"""
+    try:
+        # Accept "YYYY-MM-DD HH:MM:SS" with or without a trailing "UTC"
+        value = timestamp_str.strip()
+        if value.endswith(" UTC"):
+            value = value[:-4].rstrip()
+        
+        dt_utc = None
+        match = _DISPLAY_TIMESTAMP_RE.fullmatch(value)
+        try:
+            if match:
+                dt_utc = datetime.datetime(*map(int, match.groups()), tzinfo=datetime.timezone.utc)
+            else:
+                # Anything unusual still gets strptime's leniency
+                dt_utc = datetime.datetime.strptime(value, "%Y-%m-%d %H:%M:%S").replace(tzinfo=datetime.timezone.utc)
+        except ValueError:
+            pass
+        
+        if not dt_utc:
+            print(f"Failed to parse timestamp: {timestamp_str}")
+            return timestamp_str
+        
+        # Convert to selected timezone with consistent format. The zone name is
+        # asked per row, since it changes across DST (CST/CDT)
+        dt = dt_utc.astimezone(_get_tz(timezone_preference))
+        return _DISPLAY_FORMAT % (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.tzname() or "")
+    except Exception as e:
+        print(f"Error converting timestamp '{timestamp_str}': {e}")
+        return timestamp_str
+
+# Memoised conversion keyed on (timestamp string, timezone preference)
+_convert_ts_cached = functools.lru_cache(maxsize=8192)(_convert_display_timestamp)
+
+def _convert_display_timestamps(timestamps, timezone_preference):
+    """Convert many UTC timestamp strings at once, returning a raw -> display dict"""
+    timestamps = list(timestamps)
+    if not timestamps:
+        return {}
+    try:
+        target_tz = _get_tz(timezone_preference)
+        
+        # Parse and convert the whole column in one vectorized pass
+        raw = pd.Series(timestamps, dtype=object)
+        cleaned = raw.str.strip().str.replace(r" UTC$", "", regex=True)
+        parsed = pd.to_datetime(cleaned, format="%Y-%m-%d %H:%M:%S", errors="coerce", utc=True)
+        formatted = parsed.dt.tz_convert(target_tz).dt.strftime("%Y-%m-%d %H:%M:%S (%Z)")
+    except Exception as e:
+        print(f"Vectorized timestamp conversion failed, converting one by one: {e}")
+        return {ts: _convert_display_timestamp(ts, timezone_preference) for ts in timestamps}
+    
+    # Plain lists zip far faster than iterating the Series element by element
+    formatted = formatted.tolist()
+    parsed_ok = parsed.notna()
+    if parsed_ok.all():
+        return dict(zip(timestamps, formatted))
+    
+    display = {}
+    for ts, value, ok in zip(timestamps, formatted, parsed_ok.tolist()):
+        # Anything pandas could not parse goes through the row-wise path
+        display[ts] = value if ok else _convert_display_timestamp(ts, timezone_preference)
+    return display
+
+def _parse_int(value):
+    """Parse a count that may arrive as an int, float or "1,234" string; 0 if it is not a number"""
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        try:
+            return int(float(str(value).replace(',', '')))
+        except (ValueError, OverflowError):
+            return 0  # NaN and other junk count as no attachments
+
+def _sms_attachment(msg):
+    """Describe a message's attachments for display"""
+    attachment = ""
+    
+    # First check if we have an attachment count > 0
+    attachment_count = msg['_attachment_count'] if '_attachment_count' in msg else _parse_int(msg.get('Attachment Count'))
+    if attachment_count > 0:
+        # If we have names, show them
+        if 'Attachment Names' in msg and msg['Attachment Names']:
+            attachment = f"{attachment_count} file(s): {msg['Attachment Names']}"
+        # Otherwise just show the count
+        else:
+            attachment = f"{attachment_count} attachment(s)"
+    # Fall back to other attachment fields
+    elif 'Attachment Names' in msg and msg['Attachment Names']:
+        attachment = msg['Attachment Names']
+    elif 'Attachment Files' in msg and msg['Attachment Files']:
+        attachment = msg['Attachment Files']
+    elif 'attachment' in msg and msg['attachment']:
+        attachment = msg['attachment']
+    return attachment
+
+def _sms_service(msg):
+    """Return the message service, filling in a sensible default when missing"""
+    service = msg.get('service', '')
+    if not service or service == 'None':
+        if 'direction' in msg and msg['direction'] == 'Sent':
+            service = 'iMessage'  # Default for sent messages
+        elif 'Message Service' in msg:
+            service = msg['Message Service']
+    return service
+
+def _sms_message(msg):
+    """Return the message text, falling back to the Sent/Received columns"""
+    message = msg.get('message', '')
+    if not message:
+        # Try other possible field names
+        if 'Sent' in msg and msg['Sent']:
+            message = msg['Sent']
+        elif 'Received' in msg and msg['Received']:
+            message = msg['Received']
+    return message
+
+def _normalize_sms(messages):
+    """Give each SMS record the canonical fields read by _SMS_ROW"""
+    for msg in messages:
+        for key in ('date', 'direction', 'phone_number'):
+            msg.setdefault(key, '')
+        msg['_service'] = _sms_service(msg)
+        msg['_message'] = _sms_message(msg)
+        msg['_attachment_count'] = _parse_int(msg.get('Attachment Count'))
+        msg['_attachment'] = _sms_attachment(msg)
+
+# Fields of a normalized SMS record in SMS table column order
+_SMS_ROW = operator.itemgetter('date', 'direction', 'phone_number', '_service', '_message', '_attachment')
+
+def _safari_date(history_item):
+    """Find the visit date of a Safari history record"""
+    # Check for various possible date keys 
+    date_value = None
+    for date_key in ['Date', 'date', 'Visit Date', 'visit_date', 'DateVisited', 'date_visited', 'Last Visited', 'last_visited', 'visit_time']:
+        if date_key in history_item:
+            date_value = history_item[date_key]
+            break
+    
+    # If date not found with known keys, try to find any key containing 'date'
+    if not date_value:
+        for key in history_item.keys():
+            if 'date' in key.lower() or 'time' in key.lower():
+                date_value = history_item[key]
+                break
+    return date_value
+
+def _first_non_empty_date(record, fields):
+    """Return the first non-empty value among fields, then any key containing 'date' or 'time'"""
+    for field in fields:
+        if field in record and record[field]:
+            return record[field]
+    
+    # If not found yet, try any field containing 'date' or 'time'
+    for key in record.keys():
+        if ('date' in key.lower() or 'time' in key.lower()) and record[key]:
+            return record[key]
+    return None
+
+def _data_usage_date(usage):
+    """Find the date of a data usage record"""
+    # The parser names the column 'Date', so it is tried first
+    return _first_non_empty_date(usage, ['Date', 'Date (UTC)', 'Time', 'Timestamp', 'date', 'timestamp', 'time'])
+
+def _account_date(account):
+    """Find the date of an account record"""
+    # The parser names the column 'Account Date', so it is tried first
+    return _first_non_empty_date(account, ['Account Date', 'Account Date (UTC)', 'Date', 'Time', 'Created', 'Modified',
+                                           'creation_date', 'created_at', 'modified_at', 'timestamp'])
+
+def _note_content(note):
+    """Return a note's text from whichever content column it has"""
+    # Try different possible keys for note content
+    content = ""
+    for possible_key in ['ZCONTENT', 'content', 'Content', 'text', 'Text', 'body', 'Body', 'note_content']:
+        if possible_key in note:
+            content = str(note.get(possible_key, ''))
+            break
+    
+    # If still no content found, try to use the entire note
+    if not content and isinstance(note, dict):
+        content = str(note)
+    return content
+
+# Notes rendered per search before a "Show more" footer
+_NOTES_PAGE_SIZE = 500
+
+# Stylish separator drawn between notes
+_NOTE_SEPARATOR = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+
+def _note_date(note):
+    """Return a note's creation date, or None if it has no date column"""
+    for date_key in ['ZCREATIONDATE', 'creation_date', 'date', 'timestamp']:
+        if date_key in note:
+            return note.get(date_key, '')
+    return None
+
+def _sort_keys(records, field):
+    """Sort keys for field: numbers when every value parses as one, else casefolded text"""
+    values = [record.get(field, '') for record in records]
+    try:
+        # Count and KB columns would otherwise sort "10" before "9"
+        return [float(value) for value in values]
+    except (TypeError, ValueError):
+        # Fold each distinct value once; names and services repeat across many rows
+        texts = [str(value) for value in values]
+        folded = {text: text.casefold() for text in set(texts)}
+        return [folded[text] for text in texts]
+
+# Decoded gallery thumbnails kept in memory (about 65 KB each at 150x150)
+_THUMB_CACHE_LIMIT = 2000
+
+def _thumbnail_cache_file(cache_dir, file_path, stat, size):
+    """Path of the on-disk thumbnail for this version of file_path"""
+    key = hashlib.sha1(f"{file_path}|{stat.st_mtime_ns}|{stat.st_size}|{size}".encode()).hexdigest()
+    return os.path.join(cache_dir, f"{key}.webp")
+
+def _save_cached_thumbnail(img, cache_file):
+    """Write a thumbnail to the cache atomically; a failed write only loses the cache entry"""
+    temp_file = f"{cache_file}.{threading.get_ident()}.tmp"
+    try:
+        img.save(temp_file, "WEBP", quality=80, method=0)
+        os.replace(temp_file, cache_file)
+    except Exception as e:
+        print(f"Could not cache thumbnail: {e}")
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+def _usable_preview(preview, full_size, size):
+    """Scale an embedded preview to size if it is large enough and shaped like the image, else None"""
+    if max(preview.size) < max(size):
+        return None
+    # Some cameras letterbox previews to a fixed 4:3 box; those would show bars
+    if abs(preview.width / preview.height - full_size[0] / full_size[1]) > 0.05:
+        return None
+    preview.thumbnail(size)
+    return preview
+
+def _embedded_jpeg_thumbnail(img, size):
+    """Return the EXIF preview of an opened JPEG scaled to size, or None if it has no usable one"""
+    try:
+        raw = img.info.get("exif")
+        ifd1 = img.getexif().get_ifd(ExifTags.IFD.IFD1)
+        offset, length = ifd1.get(0x0201), ifd1.get(0x0202)  # JPEGInterchangeFormat(Length)
+        if not raw or not offset or not length:
+            return None
+        start = 6 + offset  # Offsets count from the TIFF header, after "Exif\0\0"
+        preview = Image.open(io.BytesIO(raw[start:start + length]))
+        preview.load()
+    except Exception:
+        return None
+    return _usable_preview(preview, img.size, size)
+
+def _embedded_heic_thumbnail(heic_path, size):
+    """Return the smallest HEIC thumbnail covering size, scaled to it, or None if there is none"""
+    try:
+        import pillow_heif
+        heif_file = pillow_heif.open_heif(heic_path)
+        primary = heif_file[heif_file.primary_index]
+        boxes = [(box, index) for index, box in enumerate(primary.info.get("thumbnails") or [])
+                 if box >= max(size)]
+        if not boxes:
+            return None
+        preview = primary.get_thumbnail(min(boxes)[1]).to_pillow()
+    except Exception:
+        return None
+    return _usable_preview(preview, primary.size, size)
+
+# Files shown in the photo thumbnail gallery
+_MEDIA_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.heic', '.mp4', '.mov', '.m4v', '.3gp')
+_VIDEO_EXTENSIONS = frozenset(('.mp4', '.mov', '.m4v', '.3gp'))
+
+# App method that makes a gallery thumbnail for each extension; anything else
+# goes through create_image_thumbnail
+_THUMBNAIL_DECODERS = {'.heic': "create_heic_thumbnail",
+                       **{ext: "create_video_thumbnail" for ext in _VIDEO_EXTENSIONS}}
+
+# EXIF metadata sections and the tag name keywords that file a tag under each,
+# checked in this order; tags matching none go under OTHER INFO
+_EXIF_SECTIONS = (
+    ("BASIC INFO", ('date', 'time', 'creation', 'modified')),
+    ("CAMERA INFO", ('make', 'model', 'software', 'camera')),
+    ("EXPOSURE INFO", ('exposure', 'aperture', 'iso', 'focal', 'flash')),
+    ("LOCATION DATA", ('gps', 'location', 'altitude', 'longitude', 'latitude')),
+)
+# One lookahead per section, tried in order at the start of the tag name, so a
+# single match() finds the first section with a keyword anywhere in the name;
+# match.lastindex is the section's position in _EXIF_SECTIONS plus one
+_EXIF_SECTION_RE = re.compile("|".join(
+    f"(?=.*?(?:{'|'.join(keywords)}))()" for _, keywords in _EXIF_SECTIONS), re.DOTALL)
+
+# Data field behind each sortable column id, where the two differ
+_SORT_FIELDS = {
+    "sms": {
+        "date": "Date",
+        "contact": "Contact",
+        "service": "Message Service"
+    },
+    "calls": {
+        "date": "Date",
+        "phone_number": "Phone Number"
+    },
+    "data_usage": {
+        "date": "Date",
+        "app_name": "Application Bundle",
+        "cell_in": "Cell In (KB)", 
+        "cell_out": "Cell Out (KB)"
+    },
+    "accounts": {
+        "date": "Date",
+        "username": "Username",
+        "description": "Description",
+    },
+    "permissions": {
+        "permission": "Device Permission",
+        "app_bundle": "Application Bundle",
+        "status": "Permission Status"
+    },
+    "interactions": {
+        "date": "Date",
+        "service": "Service",
+        "contact": "Contact Display Name",
+        "app": "Application ID",
+        "direction": "Direction",
+        "count": "Interaction Count",
+        "last_contact": "Last Contacted (UTC)",
+        "content_type": "Content Type"
+    }
+}
+
+# Fields matched by each table's search box
+_SEARCH_FIELDS = {
+    "sms": _SMS_ROW,
+    "calls": lambda call: (call.get('date', ''), call.get('duration', ''), call.get('phone_number', ''),
+                           call.get('direction', ''), call.get('answered', ''), call.get('call_type', '')),
+    "safari": lambda item: (_safari_date(item), item.get('Page Title', ''), item.get('URL', ''),
+                            item.get('Page Loaded', ''), item.get('Total Visit Count', '')),
+    "contacts": lambda contact: (contact.get('first_name', ''), contact.get('last_name', ''),
+                                 contact.get('main_number', ''), contact.get('mobile_number', ''),
+                                 contact.get('home_number', ''), contact.get('work_number', ''),
+                                 contact.get('email', '')),
+    "data_usage": lambda usage: (_data_usage_date(usage), usage.get('Application Bundle', '')),
+    "accounts": lambda account: (_account_date(account), account.get('Username', ''),
+                                 account.get('Description', ''), account.get('Account Type', ''),
+                                 account.get('Service', '')),
+    "permissions": lambda permission: (permission.get('Device Permission', ''),
+                                       permission.get('Application Bundle', ''),
+                                       permission.get('Permission Status', '')),
+    "photos": lambda photo: (photo.get('Filename', ''), photo.get('Path', ''),
+                             photo.get('Date Taken', ''), photo.get('Scene Classification', '')),
+    "notes": lambda note: (_note_content(note),),
+    # Interactions match against every value, dict or tuple
+    "interactions": lambda interaction: (interaction.values() if isinstance(interaction, dict) else interaction),
+}
+
+# Table columns of each record. Dated tables lead with the raw date, which the
+# filters convert for display, so a timezone change needs no rebuild
+_DISPLAY_FIELDS = {
+    "safari": lambda item: (_safari_date(item), item.get('Page Title', ''), item.get('URL', ''),
+                            item.get('Page Loaded', ''), item.get('Total Visit Count', '')),
+    "contacts": lambda contact: (contact.get('first_name', ''), contact.get('last_name', ''),
+                                 contact.get('main_number', ''), contact.get('mobile_number', ''),
+                                 contact.get('home_number', ''), contact.get('work_number', ''),
+                                 contact.get('email', '')),
+    "data_usage": lambda usage: (_data_usage_date(usage), usage.get('Application Bundle', ''),
+                                 usage.get('WWAN In (KB)', '0'), usage.get('WWAN Out (KB)', '0')),
+    "accounts": lambda account: (_account_date(account), account.get('Username', ''),
+                                 account.get('Description', ''), account.get('Account Type', ''),
+                                 account.get('Service', '')),
+    "permissions": lambda permission: (permission.get('Device Permission', ''),
+                                       permission.get('Application Bundle', ''),
+                                       permission.get('Permission Status', '')),
+    "photos": lambda photo: (photo.get('Date Taken', ''), photo.get('Filename', ''), photo.get('Path', ''),
+                             photo.get('Scene Classification', ''), photo.get('Confidence', '')),
+    "notes": lambda note: (_note_date(note), _note_content(note)),
+}
+
+def _permission_tags(values):
+    """Colour a permission row by its status"""
+    status = values[2].lower()
+    if 'granted' in status:
+        return ('granted',)
+    elif 'denied' in status:
+        return ('denied',)
+    return ('unknown',)
+
+# Layout of the tables built by _build_table and filled by _filter_table.
+# columns: (id, heading, width, anchor); date_column: where the converted raw date
+# is shown, or None; missing_date: shown for an empty date; row_tags: values -> tags
+_TABLE_SPECS = {
+    "safari": {
+        "columns": [("date", "Date Visited", 150, tk.W), ("title", "Page Title", 200, tk.W),
+                    ("url", "URL", 300, tk.W), ("loaded", "Page Loaded", 80, tk.W),
+                    ("visit_count", "Visit Count", 100, tk.E)],
+        "date_column": 0, "missing_date": "Unknown Date",
+    },
+    "contacts": {
+        "columns": [("first_name", "First Name", 100, tk.W), ("last_name", "Last Name", 100, tk.W),
+                    ("main_number", "Main Number", 120, tk.W), ("mobile_number", "Mobile", 120, tk.W),
+                    ("home_number", "Home", 120, tk.W), ("work_number", "Work", 120, tk.W),
+                    ("email", "Email", 200, tk.W)],
+        "date_column": None,
+    },
+    "data_usage": {
+        "columns": [("date", "Date", 150, tk.W), ("app_name", "Application", 200, tk.W),
+                    ("cell_in", "Cell In (KB)", 100, tk.E), ("cell_out", "Cell Out (KB)", 100, tk.E)],
+        "date_column": 0, "missing_date": "Unknown Date",
+    },
+    "accounts": {
+        "columns": [("date", "Date", 150, tk.W), ("username", "Username", 200, tk.W),
+                    ("description", "Description", 200, tk.W), ("account_type", "Account Type", 100, tk.W),
+                    ("service", "Service", 150, tk.W)],
+        "date_column": 0, "missing_date": "Unknown Date",
+    },
+    "permissions": {
+        "columns": [("app_name", "App Name", 150, tk.W), ("permission", "Permission", 150, tk.W),
+                    ("access_granted", "Access Granted", 100, tk.W), ("type", "Type", 100, tk.W),
+                    ("description", "Description", 200, tk.W)],
+        "date_column": None, "row_tags": _permission_tags,
+    },
+    "photos": {
+        "columns": [("filename", "Filename", 150, tk.W), ("path", "Path", 250, tk.W),
+                    ("date_taken", "Date Taken", 150, tk.W), ("classification", "Classification", 150, tk.W),
+                    ("confidence", "Confidence", 100, tk.E)],
+        "date_column": 2,
+    },
+}
+
+# Rows inserted straight away when a table is filled; the rest follow in batches
+_TREE_FIRST_PAGE = 200
+_TREE_BATCH_SIZE = 500
+# Typing pause before a search entry filters its table
+_SEARCH_DEBOUNCE_MS = 200
+
+# Worker status updates are applied to the UI on this tick
+_STATUS_DRAIN_MS = 50
+_STATUS_DRAIN_MAX = 200  # Log lines per tick, so a burst cannot stall the UI
+
+# Gallery thumbnail states in App.loaded_thumbnails
+_THUMB_LOADING = 1
+_THUMB_LOADED = 2
+_THUMB_ERROR = 3
+
+# Decoded gallery thumbnails are shown on this tick, a bounded number at a time
+_THUMB_DRAIN_MS = 30
+_THUMB_DRAIN_MAX = 16
+
 class App(ctk.CTk):
     def __init__(self):
         super().__init__()
 
         self.timezone_preference = f"System Time ({get_localzone()})"
+        self._timestamp_display = {}  # Raw timestamp -> display string for _timestamp_display_tz
+        self._timestamp_display_tz = None
+        # Parsed records of each results table; display_parse_results replaces them
+        self.sms_data = []
+        self.calls_data = []
+        self.contacts_data = []
+        self.data_usage_data = []
+        self.accounts_data = []
+        self.permissions_data = []
+        self.notes_data = []
+        self.photos_data = []
+        self.interactions_data = []
+        self.safari_data = []
+        self.timezone_frame = None
+        # Single worker so timezone recomputes run in order
+        self._tz_executor = ThreadPoolExecutor(max_workers=1)
+        # Shared pool for device, backup and parse work
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="arsenic-io")
+        self._device_future = None  # In-flight device probe, if any
+        # Thumbnail decoding for the photo gallery, shared by every display_photos call
+        self._thumb_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4),
+                                              thread_name_prefix="arsenic-thumb")
+        self._thumb_cache = {}  # (path, mtime, size) -> decoded thumbnail, oldest first
+        self._thumb_cache_lock = threading.Lock()  # Decoder threads add to _thumb_cache
+        self._tree_fill_jobs = {}  # Tree -> pending after() id for streamed rows
+        self._search_index = {}  # Dataset name -> (data list, lowercased search text, record start offsets)
+        self._search_jobs = {}  # Search entry -> pending after() id for its filter
+        self._filter_state = {}  # Dataset name -> (search term, data list, timezone) last shown
+        self._last_matches = {}  # Dataset name -> (haystack, search term, matching indices)
+        self._display_index = {}  # Dataset name -> (data list, column values per record)
+        # Single worker so searches finish in the order they were typed
+        self._filter_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arsenic-filter")
+        self._filter_seqs = {}  # Dataset name -> latest search; older results are dropped
+        # Single worker so header sorts finish in the order they were clicked
+        self._sort_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arsenic-sort")
+        self._sort_futures = {}  # Table name -> latest submitted sort
+        self._shown_records = {}  # Dataset name -> records its background-filled table shows
+        # Status from backup/parse threads, applied by _drain_status
+        self._status_queue = queue.Queue()  # Backup log lines
+        self._progress_latest = None  # Newest backup progress, if not yet shown
+        self._parse_status_latest = None  # Newest parse status, if not yet shown
+        self._status_jobs = 0  # Workers still reporting
+        self._status_drain_job = None
         # Configure window
         self.title("Arsenic Triage Tool - North Loop Consulting © 2025")
         self.geometry("1000x850")  # Increased window size
@@ -89,6 +731,11 @@ class App(ctk.CTk):
         logging.basicConfig(level=logging.INFO, 
                            format='%(asctime)s - %(levelname)s - %(message)s')
         
+        # Shared fonts, created once and reused by every widget
+        self._font_h16 = ctk.CTkFont(size=16, weight="bold")
+        self._font_h20 = ctk.CTkFont(size=20, weight="bold")
+        self._font_btn = ctk.CTkFont(size=14, weight="bold")
+        
         # Create the UI
         self.create_widgets()
     
@@ -100,7 +747,14 @@ class App(ctk.CTk):
              # Calculate path relative to the current file
             current_dir = os.path.dirname(os.path.abspath(__file__))
             project_root = os.path.dirname(os.path.dirname(current_dir))  # Go up two levels from src/ui
-            icon_path = os.path.join(project_root, "src", "assets", "icons", "app_icon.png")
+            icons_dir = os.path.join(project_root, "src", "assets", "icons")
+            
+            # Use the pre-resized asset matching the display density so only a
+            # small image is decoded and scaled; fall back to the full size source
+            icon_name = "app_icon_128.png" if self.tk.call('tk', 'scaling') > 1.5 else "app_icon_64.png"
+            icon_path = os.path.join(icons_dir, icon_name)
+            if not os.path.exists(icon_path):
+                icon_path = os.path.join(icons_dir, "app_icon.png")
             
          
             # Debug output
@@ -109,26 +763,14 @@ class App(ctk.CTk):
             if os.path.exists(icon_path):
                 print(f"Loading icon from: {icon_path}")
                 
-                # Load with PIL as required by CTkImage
-                pil_img = Image.open(icon_path)
-                # Inverse the image colors for dark mode
-                pil_img = pil_img.convert("RGBA")
-                 # Get data for manipulation
-                data = pil_img.getdata()
-                new_data = []
-                
-                # Invert each pixel while preserving alpha
-                for item in data:
-                    # Invert RGB but keep alpha channel
-                    new_data.append((255 - item[0], 255 - item[1], 255 - item[2], item[3]))
-                
-                # Update image with inverted colors
-                pil_img.putdata(new_data)
-
+                # Load with PIL as required by CTkImage; both variants are kept since
+                # the System appearance can switch to Dark while the app is running
+                light_img = Image.open(icon_path).convert("RGBA")
+                dark_img = _load_inverted_icon(icon_path)
                 
                 # Create CTkImage with PIL Image objects
-                self.app_icon = ctk.CTkImage(light_image=pil_img, 
-                                             dark_image=pil_img,
+                self.app_icon = ctk.CTkImage(light_image=light_img, 
+                                             dark_image=dark_img,
                                              size=(64, 64))
                 
                 # Create header frame at top of window
@@ -140,14 +782,13 @@ class App(ctk.CTk):
                 logo_label.pack(side="left", padx=10, pady=5)
                 
                 # Add title with larger, bold font
-                title_font = ctk.CTkFont(size=20, weight="bold")
                 title_label = ctk.CTkLabel(header_frame, 
                                           text="Arsenic v1.0 - Triage Tool", 
-                                          font=title_font)
+                                          font=self._font_h20)
                 title_label.pack(side="left", padx=10, pady=5)
                 
                 # Set window icon
-                icon_img = ImageTk.PhotoImage(pil_img)
+                icon_img = ImageTk.PhotoImage(dark_img if ctk.get_appearance_mode() == "Dark" else light_img)
                 self.iconphoto(True, icon_img)
             else:
                 print(f"Icon not found at path: {icon_path}")
@@ -172,8 +813,8 @@ class App(ctk.CTk):
         
     def setup_backup_tab(self):
         # Create a left and right pane for the backup tab
+        # Packed once all children exist so the tab is laid out in a single pass
         self.backup_panes = ctk.CTkFrame(self.tab_backup)
-        self.backup_panes.pack(fill="both", expand=True, padx=5, pady=5)
         
         # Left pane for device info and backup options
         self.left_pane = ctk.CTkFrame(self.backup_panes)
@@ -190,7 +831,7 @@ class App(ctk.CTk):
         
         self.device_label = ctk.CTkLabel(self.device_frame, 
                                         text="Device Information", 
-                                        font=ctk.CTkFont(size=16, weight="bold"))
+                                        font=self._font_h16)
         self.device_label.pack(pady=5)
         
         self.device_status = ctk.CTkLabel(self.device_frame, text="No device connected")
@@ -210,7 +851,7 @@ class App(ctk.CTk):
         
         self.options_label = ctk.CTkLabel(self.options_frame, 
                                          text="Backup Options", 
-                                         font=ctk.CTkFont(size=16, weight="bold"))
+                                         font=self._font_h16)
         self.options_label.pack(pady=5)
         
         # Backup folder selection
@@ -239,7 +880,7 @@ class App(ctk.CTk):
         # Backup button
         self.backup_button = ctk.CTkButton(self.options_frame, 
                                           text="Start Backup", 
-                                          font=ctk.CTkFont(size=14, weight="bold"),
+                                          font=self._font_btn,
                                           height=40,
                                           command=self.start_backup)
         self.backup_button.pack(pady=15)
@@ -250,7 +891,7 @@ class App(ctk.CTk):
         
         self.progress_label = ctk.CTkLabel(self.progress_frame, 
                                           text="Status", 
-                                          font=ctk.CTkFont(size=16, weight="bold"))
+                                          font=self._font_h16)
         self.progress_label.pack(pady=5)
         
         self.progress_bar = ctk.CTkProgressBar(self.progress_frame)
@@ -266,7 +907,7 @@ class App(ctk.CTk):
         
         self.apps_label = ctk.CTkLabel(self.apps_frame, 
                                       text="Installed Applications", 
-                                      font=ctk.CTkFont(size=16, weight="bold"))
+                                      font=self._font_h16)
         self.apps_label.pack(pady=5)
         
         # Search box for apps
@@ -277,6 +918,7 @@ class App(ctk.CTk):
         self.search_label.pack(side="left", padx=5)
         
         self.search_var = tk.StringVar()
+        self._filter_after_id = None  # Pending debounced filter
         self.search_var.trace("w", self.filter_apps_list)
         
         self.search_entry = ctk.CTkEntry(self.search_frame, textvariable=self.search_var)
@@ -295,12 +937,16 @@ class App(ctk.CTk):
         
         # Store apps for filtering
         self.current_apps = []
+        self._current_apps_lower = []
+        
+        # Attach the finished pane tree to the tab
+        self.backup_panes.pack(fill="both", expand=True, padx=5, pady=5)
         
     def setup_parse_tab(self):
         """Set up the parse backup tab"""
         # Create a frame for the backup selection
+        # Top and results frames are packed at the end, once fully populated
         self.parse_top_frame = ctk.CTkFrame(self.tab_parse)
-        self.parse_top_frame.pack(fill="x", padx=10, pady=10)
         
         # Configure grid to ensure proper spacing
         self.parse_top_frame.columnconfigure(1, weight=1)
@@ -373,70 +1019,7 @@ class App(ctk.CTk):
         timezone_label = ctk.CTkLabel(timezone_frame, text="Display times in:")
         timezone_label.pack(side="left", padx=5, pady=5)
 
-        # Default options - system timezone and UTC
-        import pytz
-        from tzlocal import get_localzone
-
-        # Get system timezone
-        system_tz = get_localzone()
-        def get_utc_offset(timezone_str):
-            if timezone_str == "UTC":
-                return "+00:00"
-            
-            try:
-                tz = pytz.timezone(timezone_str)
-                now = datetime.datetime.now(tz)
-                offset_str = now.strftime('%z')  # Format like '+0200' or '-0500'
-                # Format more nicely as '+02:00' or '-05:00'
-                return f"{offset_str[:3]}:{offset_str[3:]}"
-            except:
-                return ""
-
-        system_offset = get_utc_offset(str(system_tz))
-        # Create timezone options list and store as class attribute
-        self.timezone_options = [
-            (f"System Time ({system_tz})", system_offset),
-            ("UTC", "+00:00"),
-            ("America/Hawaii", get_utc_offset("Pacific/Honolulu")),       # -10:00
-            ("America/Alaska", get_utc_offset("America/Anchorage")),      # -09:00
-            ("America/Pacific", get_utc_offset("America/Los_Angeles")),   # -08:00 or -07:00
-            ("America/Mountain", get_utc_offset("America/Denver")),       # -07:00 or -06:00
-            ("America/Central", get_utc_offset("America/Chicago")),       # -06:00 or -05:00
-            ("America/Eastern", get_utc_offset("America/New_York")),      # -05:00 or -04:00
-            ("America/Bogota", get_utc_offset("America/Bogota")),         # -05:00
-            ("America/Toronto", get_utc_offset("America/Toronto")),       # -05:00 or -04:00
-            ("America/Lima", get_utc_offset("America/Lima")),             # -05:00
-            ("America/Santiago", get_utc_offset("America/Santiago")),     # -04:00 or -03:00
-            ("America/Sao_Paulo", get_utc_offset("America/Sao_Paulo")),   # -03:00
-            ("America/Buenos_Aires", get_utc_offset("America/Argentina/Buenos_Aires")), # -03:00
-            ("Europe/Reykjavik", get_utc_offset("Atlantic/Reykjavik")),   # +00:00
-            ("Europe/London", get_utc_offset("Europe/London")),           # +00:00 or +01:00
-            ("Europe/Berlin", get_utc_offset("Europe/Berlin")),           # +01:00 or +02:00
-            ("Europe/Paris", get_utc_offset("Europe/Paris")),             # +01:00 or +02:00
-            ("Europe/Madrid", get_utc_offset("Europe/Madrid")),           # +01:00 or +02:00
-            ("Europe/Rome", get_utc_offset("Europe/Rome")),               # +01:00 or +02:00
-            ("Europe/Amsterdam", get_utc_offset("Europe/Amsterdam")),     # +01:00 or +02:00
-            ("Europe/Zurich", get_utc_offset("Europe/Zurich")),           # +01:00 or +02:00
-            ("Europe/Kyiv", get_utc_offset("Europe/Kiev")),               # +02:00 or +03:00
-            ("Africa/Lagos", get_utc_offset("Africa/Lagos")),             # +01:00
-            ("Africa/Cairo", get_utc_offset("Africa/Cairo")),             # +02:00
-            ("Africa/Johannesburg", get_utc_offset("Africa/Johannesburg")), # +02:00
-            ("Africa/Nairobi", get_utc_offset("Africa/Nairobi")),         # +03:00
-            ("Europe/Moscow", get_utc_offset("Europe/Moscow")),           # +03:00
-            ("Asia/Dubai", get_utc_offset("Asia/Dubai")),                 # +04:00
-            ("Asia/Kolkata", get_utc_offset("Asia/Kolkata")),             # +05:30
-            ("Asia/Bangkok", get_utc_offset("Asia/Bangkok")),             # +07:00
-            ("Asia/Singapore", get_utc_offset("Asia/Singapore")),         # +08:00
-            ("Asia/Hong_Kong", get_utc_offset("Asia/Hong_Kong")),         # +08:00
-            ("Asia/Shanghai", get_utc_offset("Asia/Shanghai")),           # +08:00
-            ("Asia/Seoul", get_utc_offset("Asia/Seoul")),                 # +09:00
-            ("Asia/Tokyo", get_utc_offset("Asia/Tokyo")),                 # +09:00
-            ("Australia/Perth", get_utc_offset("Australia/Perth")),       # +08:00
-            ("Australia/Sydney", get_utc_offset("Australia/Sydney")),     # +10:00 or +11:00
-            ("Australia/Melbourne", get_utc_offset("Australia/Melbourne")), # +10:00 or +11:00
-            ("Pacific/Auckland", get_utc_offset("Pacific/Auckland"))    # +12:00 or +13:00
-        ]
-        self.timezone_options = [f"{name} {offset}" for name, offset in self.timezone_options]
+        self.timezone_options = list(_TIMEZONE_OPTIONS)
 
         self.timezone_var = tk.StringVar(value=self.timezone_options[0])  # Default to system time
         self.timezone_dropdown = ctk.CTkOptionMenu(
@@ -455,7 +1038,7 @@ class App(ctk.CTk):
         
         self.parse_button = ctk.CTkButton(
             self.button_frame, text="Parse Backup", 
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font_btn,
             height=40, width=200,
             command=self.start_parse
         )
@@ -470,7 +1053,6 @@ class App(ctk.CTk):
         
         # Results frame
         self.parse_results_frame = ctk.CTkFrame(self.tab_parse)
-        self.parse_results_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Create the results tabview FIRST - this is the critical fix
         self.parse_results_tabview = ctk.CTkTabview(self.parse_results_frame)
@@ -489,19 +1071,55 @@ class App(ctk.CTk):
         self.tab_notes = self.parse_results_tabview.add("Notes")
         self.tab_photos = self.parse_results_tabview.add("Photos")  
         
-        # Set up individual content areas - call these AFTER creating tabs
+        # Set up individual content areas - call these AFTER creating tabs.
+        # Device Info is shown first; the other tabs are built on first selection
         self.setup_device_info()
-        self.setup_sms_table()
-        self.setup_calls_table()
-        self.setup_contacts_table()
-        self.setup_data_usage_table()
-        self.setup_accounts_table()
-        self.setup_permissions_table()
-        self.setup_photos_table()
-        self.setup_notes_table()
-        self.setup_interactions_table()
-        self.setup_safari_table()
+        self._tab_builders = {
+            "SMS Messages": (self.setup_sms_table, "sms"),
+            "Call History": (self.setup_calls_table, "calls"),
+            "Interactions": (self.setup_interactions_table, "interactions"),
+            "Safari History": (self.setup_safari_table, "safari"),
+            "Contacts": (self.setup_contacts_table, "contacts"),
+            "Data Usage": (self.setup_data_usage_table, "data_usage"),
+            "Accounts": (self.setup_accounts_table, "accounts"),
+            "App Permissions": (self.setup_permissions_table, "permissions"),
+            "Notes": (self.setup_notes_table, "notes"),
+            "Photos": (self.setup_photos_table, "photos"),
+        }
+        self.parse_results_tabview.configure(command=self._on_results_tab_changed)
+        
+        # Attach the finished frames to the tab
+        self.parse_top_frame.pack(fill="x", padx=10, pady=10)
+        self.parse_results_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+    def _on_results_tab_changed(self):
+        """Build a results tab the first time it is selected and fill it with any parsed data"""
+        builder = self._tab_builders.pop(self.parse_results_tabview.get(), None)
+        if builder is None:
+            return
         
+        setup, name = builder
+        setup()
+        if name != "notes":
+            self._bind_sort_headings(name)
+        
+        # Populate from results that arrived before the tab existed
+        if getattr(self, 'parse_results', None):
+            filter_funcs = {
+                "sms": self.filter_sms_results,
+                "calls": self.filter_call_results,
+                "interactions": self.filter_interactions_results,
+                "safari": self.filter_safari_results,
+                "contacts": self.filter_contacts_results,
+                "data_usage": self.filter_data_usage_results,
+                "accounts": self.filter_accounts_results,
+                "permissions": self.filter_permissions_results,
+                "notes": self.filter_notes_results,
+                "photos": self.filter_photos_results,
+            }
+            filter_funcs[name]("")
+            if name == "photos":
+                self._show_extracted_photos()
         
     def browse_folder(self):
         """Open folder browser dialog"""
@@ -535,13 +1153,66 @@ class App(ctk.CTk):
         """Update progress bar"""
         self.progress_bar.set(value / 100)
         
+    def _post_progress(self, value):
+        """Record backup progress from a worker thread; only the newest value is shown"""
+        self._progress_latest = value
+
+    def _post_parse_status(self, message):
+        """Record parse status from a worker thread; only the newest message is shown"""
+        self._parse_status_latest = message
+
+    def _start_status_drain(self):
+        """Register a reporting worker and make sure its updates are being drained"""
+        self._status_jobs += 1
+        if self._status_drain_job is None:
+            self._status_drain_job = self.after(_STATUS_DRAIN_MS, self._drain_status)
+
+    def _apply_status_updates(self, limit=None):
+        """Show queued log lines and the newest progress/parse status"""
+        messages = []
+        while limit is None or len(messages) < limit:
+            try:
+                messages.append(self._status_queue.get_nowait())
+            except queue.Empty:
+                break
+        if messages:
+            self.update_status("\n".join(messages))
+        
+        progress, self._progress_latest = self._progress_latest, None
+        if progress is not None:
+            self.update_progress(progress)
+        
+        parse_status, self._parse_status_latest = self._parse_status_latest, None
+        if parse_status is not None:
+            self.update_parse_status(parse_status)
+
+    def _drain_status(self):
+        """Apply worker status updates in one go, rescheduling while workers are reporting"""
+        self._apply_status_updates(_STATUS_DRAIN_MAX)
+        if self._status_jobs or not self._status_queue.empty():
+            self._status_drain_job = self.after(_STATUS_DRAIN_MS, self._drain_status)
+        else:
+            self._status_drain_job = None
+
+    def _finish_status_job(self, then=None):
+        """Flush a finished worker's last updates, then run its completion step"""
+        self._apply_status_updates()
+        self._status_jobs -= 1
+        if then:
+            then()
+
     def refresh_device_info(self):
         """Get information about connected device"""
+        # A probe is already running; its result will update the UI
+        if self._device_future is not None and not self._device_future.done():
+            return
+        
         self.device_info_text.delete("1.0", "end")
         self.device_status.configure(text="Checking for connected devices...")
         self.apps_list.delete("1.0", "end")
         self.apps_count.configure(text="0 apps")
         self.current_apps = []
+        self._current_apps_lower = []
         
         def get_info():
             from src.backup.device_backup import DeviceBackup
@@ -556,8 +1227,8 @@ class App(ctk.CTk):
                 self.after(0, lambda: self.device_status.configure(
                     text="No device connected"))
         
-        # Run in thread to prevent UI freezing
-        threading.Thread(target=get_info, daemon=True).start()
+        # Run on the shared worker pool to prevent UI freezing
+        self._device_future = self._io_pool.submit(get_info)
         
     def _update_device_info(self, device_info):
         """Update device info in the UI"""
@@ -577,6 +1248,7 @@ class App(ctk.CTk):
             # Update apps list separately
             apps = device_info.get('Installed Applications', [])
             self.current_apps = apps
+            self._current_apps_lower = [app.lower() for app in apps]
             if apps:
                 # Update apps count
                 self.apps_count.configure(text=f"{len(apps)} applications")
@@ -592,17 +1264,25 @@ class App(ctk.CTk):
     def update_apps_list(self, apps):
         """Update the apps list with the given apps"""
         self.apps_list.delete("1.0", "end")
-        for app in sorted(apps):
-            self.apps_list.insert("end", f"• {app}\n")
+        # Single insert instead of one Tk call per app
+        self.apps_list.insert("end", "".join(f"• {app}\n" for app in sorted(apps)))
             
     def filter_apps_list(self, *args):
+        """Filter the apps list shortly after the last keystroke"""
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(150, self._do_filter_apps)
+        
+    def _do_filter_apps(self):
         """Filter the apps list based on search text"""
+        self._filter_after_id = None
         search_text = self.search_var.get().lower()
         if not self.current_apps:
             return
             
         if search_text:
-            filtered_apps = [app for app in self.current_apps if search_text in app.lower()]
+            filtered_apps = [app for app, app_lower in zip(self.current_apps, self._current_apps_lower)
+                             if search_text in app_lower]
             self.update_apps_list(filtered_apps)
             self.apps_count.configure(text=f"{len(filtered_apps)} of {len(self.current_apps)} applications")
         else:
@@ -613,105 +1293,92 @@ class App(ctk.CTk):
         """Update the application's timezone preference"""
         self.timezone_preference = selected_timezone
         
-        # If we have any displayed data, refresh it with the new timezone
+        # If we have any displayed data, convert its timestamps in the background
         if hasattr(self, 'parse_results') and self.parse_results:
-            self.refresh_displayed_timestamps()
+            self.update_parse_status(f"Converting displayed times to {selected_timezone}...")
+            self._tz_executor.submit(self._recompute_all_tz, selected_timezone)
+
+    def _build_timestamp_display(self, timezone_preference):
+        """Map every distinct timestamp in the loaded data to its display string (no Tk calls)"""
+        timestamps = set()
+        for name in _TIMESTAMP_DATASETS:
+            for record in getattr(self, f"{name}_data", None) or []:
+                if isinstance(record, dict):
+                    values = [value for key, value in record.items() if _is_timestamp_key(key)]
+                else:
+                    values = record[:2]  # Interaction tuples start with event start/end
+                timestamps.update(value for value in values if value and isinstance(value, str))
+        return _convert_display_timestamps(timestamps, timezone_preference)
+
+    def _recompute_all_tz(self, timezone_preference):
+        """Convert every displayed timestamp for a timezone (worker thread, no Tk calls)"""
+        display = self._build_timestamp_display(timezone_preference)
+        
+        # Hand the finished conversions back to the main thread
+        self.after(0, lambda: self._apply_timezone_display(timezone_preference, display))
+
+    def _apply_timezone_display(self, timezone_preference, display):
+        """Swap in precomputed timestamps and redraw the tables"""
+        if timezone_preference != self.timezone_preference:
+            return  # A newer selection superseded this one
+        self._timestamp_display = display
+        self._timestamp_display_tz = timezone_preference
+        self.refresh_displayed_timestamps()
 
     def refresh_displayed_timestamps(self):
         """Refresh all displayed data with the current timezone"""
         # Re-filter all data with new timezone settings
-        if hasattr(self, 'sms_data') and self.sms_data:
+        if hasattr(self, 'sms_search_entry') and self.sms_data:
             self.filter_sms_results(self.sms_search_entry.get())
         
-        if hasattr(self, 'calls_data') and self.calls_data:
+        if hasattr(self, 'calls_search_entry') and self.calls_data:
             self.filter_call_results(self.calls_search_entry.get())
         
-        if hasattr(self, 'safari_data') and self.safari_data:
+        if hasattr(self, 'safari_search_entry') and self.safari_data:
             self.filter_safari_results(self.safari_search_entry.get())
         
-        if hasattr(self, 'contacts_data') and self.contacts_data:
+        if hasattr(self, 'contacts_search_entry') and self.contacts_data:
             self.filter_contacts_results(self.contacts_search_entry.get())
         
-        if hasattr(self, 'data_usage_data') and self.data_usage_data:   
+        if hasattr(self, 'data_usage_search_entry') and self.data_usage_data:   
             self.filter_data_usage_results(self.data_usage_search_entry.get())
             
-        if hasattr(self, 'accounts_data') and self.accounts_data:
+        if hasattr(self, 'accounts_search_entry') and self.accounts_data:
             self.filter_accounts_results(self.accounts_search_entry.get())
             
-        if hasattr(self, 'permissions_data') and self.permissions_data:
+        if hasattr(self, 'permissions_search_entry') and self.permissions_data:
             self.filter_permissions_results(self.permissions_search_entry.get())
             
-        if hasattr(self, 'notes_data') and self.notes_data:
+        if hasattr(self, 'notes_search_entry') and self.notes_data:
             self.filter_notes_results(self.notes_search_entry.get())
             
-        if hasattr(self, 'photos_data') and self.photos_data:
+        if hasattr(self, 'photos_search_entry') and self.photos_data:
             self.filter_photos_results(self.photos_search_entry.get())
             
-        if hasattr(self, 'interactions_data') and self.interactions_data:
+        if hasattr(self, 'interactions_search_entry') and self.interactions_data:
             self.filter_interactions_results(self.interactions_search_entry.get())
         
         self.update_parse_status(f"Updated displayed times to {self.timezone_preference}")
 
     def convert_timestamp(self, timestamp_str):
         """Convert a timestamp string from UTC to the selected timezone"""
-        import datetime
-        import pytz
-        from tzlocal import get_localzone
-        
         if not timestamp_str:
             return timestamp_str
         
         # Make sure we have the timezone preference
         if not hasattr(self, 'timezone_preference') or not self.timezone_preference:
-            from tzlocal import get_localzone
             self.timezone_preference = f"System Time ({get_localzone()})"
             print(f"Initialized timezone preference to {self.timezone_preference}")
         
-        try:
-            # Debug
-            # print(f"Converting: '{timestamp_str}' to {self.timezone_preference}")
-            
-            # Handle different timestamp formats
-            dt_utc = None
-            formats_to_try = [
-                "%Y-%m-%d %H:%M:%S UTC",  # Format with UTC suffix
-                "%Y-%m-%d %H:%M:%S",      # Format without timezone
-            ]
-            
-            for fmt in formats_to_try:
-                try:
-                    if "UTC" in fmt:
-                        dt_utc = datetime.datetime.strptime(timestamp_str.strip(), fmt)
-                        dt_utc = dt_utc.replace(tzinfo=pytz.UTC)
-                        break
-                    else:
-                        # For formats without explicit timezone
-                        dt_utc = datetime.datetime.strptime(timestamp_str.strip(), fmt)
-                        dt_utc = dt_utc.replace(tzinfo=pytz.UTC)
-                        break
-                except ValueError:
-                    continue
-            
-            if not dt_utc:
-                print(f"Failed to parse timestamp: {timestamp_str}")
-                return timestamp_str
-            
-            # Convert to selected timezone with consistent format
-            timezone_format = "%Y-%m-%d %H:%M:%S (%Z)"
-            
-            if self.timezone_preference.startswith("System Time"):
-                local_tz = get_localzone()
-                dt_local = dt_utc.astimezone(local_tz)
-                return dt_local.strftime(timezone_format)
-            elif self.timezone_preference == "UTC":
-                return dt_utc.strftime(timezone_format)  # Always show (UTC)
-            else:
-                target_tz = pytz.timezone(self.timezone_preference)
-                dt_target = dt_utc.astimezone(target_tz)
-                return dt_target.strftime(timezone_format)
-        except Exception as e:
-            print(f"Error converting timestamp '{timestamp_str}': {e}")
-            return timestamp_str
+        if not isinstance(timestamp_str, str):
+            return _convert_display_timestamp(timestamp_str, self.timezone_preference)
+        
+        # Prefer the map precomputed in the background for this timezone
+        if self._timestamp_display_tz == self.timezone_preference:
+            display = self._timestamp_display.get(timestamp_str)
+            if display is not None:
+                return display
+        return _convert_ts_cached(timestamp_str, self.timezone_preference)
 
     def start_backup(self):
         """Start the backup process"""
@@ -728,29 +1395,28 @@ class App(ctk.CTk):
         self.update_status("Starting backup process...")
         self.backup_button.configure(state="disabled")
         
-        # Run backup in a thread
+        # Run backup in a thread; its updates are queued and drained on the UI tick
         def run_backup():
             try:
                 result = initiate_backup(
                     path=folder_path,
                     backup_logs=include_logs,
-                    status_callback=lambda msg: self.after(0, lambda: self.update_status(msg)),
-                    progress_callback=lambda val: self.after(0, lambda: self.update_progress(val))
+                    status_callback=self._status_queue.put,
+                    progress_callback=self._post_progress
                 )
                 
-                self.after(0, lambda: self.update_status(
-                    "Backup completed successfully!" if result else "Backup failed!"))
-                self.after(0, lambda: self.backup_button.configure(state="normal"))
+                self._status_queue.put("Backup completed successfully!" if result else "Backup failed!")
             except Exception as e:
-                self.after(0, lambda: self.update_status(f"Error: {str(e)}"))
-                self.after(0, lambda: self.backup_button.configure(state="normal"))
-                
-        threading.Thread(target=run_backup, daemon=True).start()
+                self._status_queue.put(f"Error: {str(e)}")
+            self.after(0, self._finish_status_job, lambda: self.backup_button.configure(state="normal"))
+        
+        self._start_status_drain()
+        self._io_pool.submit(run_backup)
         
     def start_parse(self):
         """Start parsing an iOS backup"""
         backup_path = self.backup_folder_path.get()
-        if not backup_path or not os.path.exists(backup_path):
+        if not backup_path or not os.path.isdir(backup_path):
             messagebox.showerror("Error", "Please select a valid backup folder")
             return
         
@@ -774,20 +1440,18 @@ class App(ctk.CTk):
         # Run parsing in a separate thread to avoid freezing UI
         def run_parsing():
             try:
-                from src.parser.backup_parser import parse_backup
                 results = parse_backup(
                     backup_path=backup_path, 
                     password=password, 
-                    status_callback=self.update_parse_status, 
+                    status_callback=self._post_parse_status, 
                     output_dir=output_dir,
                     taxonomy_target=taxonomy_target,
                     timezone=self.timezone_preference
                 )
                 
                 # Update UI with results on the main thread
-                self.after(100, lambda: self.display_parse_results(results))
+                self.after(100, self._finish_status_job, lambda: self.display_parse_results(results))
             except Exception as e:
-                import traceback
                 error_message = f"Error parsing backup: {e}\n\n"
                 error_details = traceback.format_exc()
                 full_error = error_message + error_details
@@ -796,10 +1460,11 @@ class App(ctk.CTk):
                 print(f"PARSING ERROR: {full_error}")
                 
                 # Display a shorter message in the UI
-                self.after(100, lambda m=error_message: self.update_parse_status(m))
+                self._parse_status_latest = error_message
+                self.after(100, self._finish_status_job)
         
-        import threading
-        threading.Thread(target=run_parsing).start()
+        self._start_status_drain()
+        self._io_pool.submit(run_parsing)
 
     def display_parse_results(self, results):
         """Display parsed results in the GUI tables"""
@@ -825,6 +1490,7 @@ class App(ctk.CTk):
         self.device_result.configure(state="disabled")
         
         # Store the data for filtering
+        self.parse_results = results
         self.sms_data = results.get('sms_messages', [])
         self.calls_data = results.get('call_history', [])
         self.contacts_data = results.get('contacts', [])
@@ -835,6 +1501,19 @@ class App(ctk.CTk):
         self.photos_data = results.get('photo_analysis', [])
         self.interactions_data = results.get('interactions', [])
         self.safari_data = results.get('safari_history', [])  
+        
+        # Work out each message's service, text and attachments once, not per search
+        _normalize_sms(self.sms_data)
+        
+        # Convert all timestamps once so the tables only look up display strings
+        self._timestamp_display = self._build_timestamp_display(self.timezone_preference)
+        self._timestamp_display_tz = self.timezone_preference
+        
+        # Build every table's lowercased search text up front, so no search pays for it
+        for name in _SEARCH_FIELDS:
+            self._search_haystack(name)
+        for name in _DISPLAY_FIELDS:
+            self._display_rows(name)
 
         # Populate SMS table
         self.filter_sms_results("")
@@ -864,31 +1543,45 @@ class App(ctk.CTk):
             self.filter_photos_results("")
             
             # Show extracted photos path and thumbnails if available
-            if 'extracted_photos_path' in results:
-                # Create path info in the analysis tab
-                path_frame = ctk.CTkFrame(self.photo_analysis_tab)
-                path_frame.pack(padx=10, pady=(5, 0), anchor="w", fill="x")
-                
-                path_label = ctk.CTkLabel(
-                    path_frame, 
-                    text=f"Extracted photos: {results['extracted_photos_path']}", 
-                    fg_color="#4caf50",
-                    text_color="white",
-                    corner_radius=6
-                )
-                path_label.pack(side="left", padx=10, pady=5)
-                
-                # Add button to open folder
-                open_folder_button = ctk.CTkButton(
-                    path_frame, 
-                    text="Open Photos Folder", 
-                    command=lambda: os.system(f"open {results['extracted_photos_path']}")
-                )
-                open_folder_button.pack(side="left", padx=10, pady=5)
-                
-                # Display thumbnails and switch to thumbnails tab
-                self.display_photos(results['extracted_photos_path'])
-                self.photos_notebook.select(1)  # Switch to thumbnails tab
+            self._show_extracted_photos()
+
+    def _show_extracted_photos(self):
+        """Show the extracted photos folder and its thumbnails in the Photos tab"""
+        results = self.parse_results
+        if 'extracted_photos_path' in results:
+            # Create path info in the analysis tab
+            path_frame = ctk.CTkFrame(self.photo_analysis_tab)
+            path_frame.pack(padx=10, pady=(5, 0), anchor="w", fill="x")
+            
+            path_label = ctk.CTkLabel(
+                path_frame, 
+                text=f"Extracted photos: {results['extracted_photos_path']}", 
+                fg_color="#4caf50",
+                text_color="white",
+                corner_radius=6
+            )
+            path_label.pack(side="left", padx=10, pady=5)
+            
+            # Add button to open folder
+            open_folder_button = ctk.CTkButton(
+                path_frame, 
+                text="Open Photos Folder", 
+                command=lambda: self._open_folder(results['extracted_photos_path'])
+            )
+            open_folder_button.pack(side="left", padx=10, pady=5)
+            
+            # Display thumbnails and switch to thumbnails tab; thumbnails are cached
+            # in the report folder beside the extracted photos
+            photos_path = results['extracted_photos_path']
+            self.display_photos(photos_path, os.path.join(os.path.dirname(photos_path), "thumbnail_cache"))
+            self.photos_notebook.select(1)  # Switch to thumbnails tab
+
+    def _open_folder(self, path):
+        """Show a folder in the system file browser"""
+        try:
+            _open_with_system(path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open folder: {str(e)}")
 
     def update_parse_status(self, message):
         """Update the status text in the parse tab"""
@@ -903,6 +1596,233 @@ class App(ctk.CTk):
             self.output_folder_path.delete(0, tk.END)
             self.output_folder_path.insert(0, folder_path)
 
+    def _search_haystack(self, name):
+        """Return the lowercased search text of all <name>_data records and each record's start offset"""
+        data = getattr(self, f"{name}_data", None) or []
+        cached = self._search_index.get(name)
+        if cached is None or cached[0] is not data:
+            separator = " " if name == "interactions" else "\x00"
+            fields = _SEARCH_FIELDS[name]
+            blobs = [separator.join(str(value) for value in fields(record)).lower() for record in data]
+            
+            # One string for the whole table; NUL between records keeps matches inside a record
+            starts = []
+            offset = 0
+            for blob in blobs:
+                starts.append(offset)
+                offset += len(blob) + 1
+            cached = self._search_index[name] = (data, "\x00".join(blobs), starts)
+        return cached[1], cached[2]
+
+    def _display_rows(self, name):
+        """Return the _DISPLAY_FIELDS tuple of each record in <name>_data, rebuilt when the list changes"""
+        data = getattr(self, f"{name}_data", None) or []
+        cached = self._display_index.get(name)
+        if cached is None or cached[0] is not data:
+            fields = _DISPLAY_FIELDS[name]
+            cached = self._display_index[name] = (data, [fields(record) for record in data])
+        return cached[1]
+
+    def _search_matches(self, name, search_term):
+        """Return the indices of <name>_data records whose search text contains the lowercased search_term"""
+        haystack, starts = self._search_haystack(name)
+        if not search_term:
+            return range(len(starts))
+        
+        find = haystack.find
+        count = len(starts)
+        last = self._last_matches.get(name)
+        if last is not None and last[0] is haystack and search_term.startswith(last[1]):
+            # Typing on: matches of the longer term are a subset of the previous matches
+            total = len(haystack)
+            matches = [i for i in last[2]
+                       if find(search_term, starts[i], starts[i + 1] - 1 if i + 1 < count else total) != -1]
+        else:
+            # Scan the whole table with str.find, jumping to the next record after each hit
+            matches = []
+            pos = find(search_term)
+            while pos != -1:
+                i = bisect_right(starts, pos) - 1
+                matches.append(i)
+                if i + 1 == count:
+                    break
+                pos = find(search_term, starts[i + 1])
+        
+        self._last_matches[name] = (haystack, search_term, matches)
+        return matches
+
+    def _filter_unchanged(self, name, search_term):
+        """Return True if the <name> table already shows search_term for the current data and timezone"""
+        state = (search_term.lower(), getattr(self, f"{name}_data", None), getattr(self, 'timezone_preference', None))
+        last = self._filter_state.get(name)
+        if last is not None and last[0] == state[0] and last[1] is state[1] and last[2] == state[2]:
+            return True
+        self._filter_state[name] = state
+        return False
+
+    def _bind_search(self, entry, filter_func):
+        """Filter as the user types, once typing pauses for _SEARCH_DEBOUNCE_MS"""
+        key = str(entry)
+
+        def run_filter():
+            self._search_jobs.pop(key, None)
+            filter_func(entry.get())
+
+        def on_key(event):
+            pending = self._search_jobs.pop(key, None)
+            if pending:
+                self.after_cancel(pending)
+            self._search_jobs[key] = self.after(_SEARCH_DEBOUNCE_MS, run_filter)
+
+        entry.bind("<KeyRelease>", on_key)
+
+    def _build_table(self, parent, name, filter_func):
+        """Build the search bar and Treeview for a _TABLE_SPECS table, returning the tree"""
+        # Create frame for search controls
+        search_frame = ctk.CTkFrame(parent)
+        search_frame.pack(fill="x", padx=10, pady=5)
+        
+        # Add search label and entry
+        search_label = ctk.CTkLabel(search_frame, text="Search:")
+        search_label.pack(side="left", padx=5, pady=5)
+        
+        search_entry = ctk.CTkEntry(search_frame, width=250)
+        search_entry.pack(side="left", padx=5, pady=5, fill="x", expand=True)
+        self._bind_search(search_entry, filter_func)
+        setattr(self, f"{name}_search_entry", search_entry)
+        
+        # Add search button
+        search_button = ctk.CTkButton(
+            search_frame, text="Search", 
+            command=lambda: filter_func(search_entry.get())
+        )
+        search_button.pack(side="left", padx=5, pady=5)
+        
+        # Add clear button
+        clear_button = ctk.CTkButton(
+            search_frame, text="Clear", 
+            command=lambda: [search_entry.delete(0, tk.END), filter_func("")]
+        )
+        clear_button.pack(side="left", padx=5, pady=5)
+        
+        # Create frame for table
+        table_frame = ctk.CTkFrame(parent)
+        table_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        # Create Treeview and its columns
+        columns = _TABLE_SPECS[name]["columns"]
+        tree = ttk.Treeview(table_frame)
+        tree["columns"] = tuple(column for column, _, _, _ in columns)
+        
+        tree.column("#0", width=0, stretch=tk.NO)  # Hide the first column
+        tree.heading("#0", text="", anchor=tk.W)
+        for column, heading, width, anchor in columns:
+            tree.column(column, anchor=anchor, width=width)
+            tree.heading(column, text=heading, anchor=anchor)
+        
+        # Add scrollbars
+        y_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
+        x_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=tree.xview)
+        tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+        
+        # Pack everything
+        y_scrollbar.pack(side="right", fill="y")
+        x_scrollbar.pack(side="bottom", fill="x")
+        tree.pack(fill="both", expand=True)
+        return tree
+
+    def _filter_table(self, name, search_term):
+        """Fill a _TABLE_SPECS table with the <name>_data records matching search_term"""
+        if not hasattr(self, f"{name}_tree"):
+            return  # Tab not built yet; it is filled when first opened
+        if self._filter_unchanged(name, search_term):
+            return  # Already showing this search
+        
+        self._filter_in_background(name, lambda: self._compute_table_rows(name, search_term))
+
+    def _compute_table_rows(self, name, search_term):
+        """Return (text, values, tags) for each <name>_data record matching search_term"""
+        spec = _TABLE_SPECS[name]
+        date_column = spec["date_column"]
+        missing_date = spec.get("missing_date")
+        row_tags = spec.get("row_tags")
+        
+        rows = []  # (text, values, tags) for each displayed row
+        data = getattr(self, f"{name}_data", None)
+        if data:
+            # Debug - log keys for first item to see available fields
+            logging.debug("%s keys: %s", name, data[0].keys())
+            
+            display = self._display_rows(name)
+            convert = self.convert_timestamp
+            
+            # Add filtered items
+            for i in self._search_matches(name, search_term.lower()):
+                row = display[i]
+                if date_column is None:
+                    values = row
+                else:
+                    # The raw date leads the cached row; show it converted in its column
+                    date_value = row[0]
+                    date_display = convert(date_value) if date_value or missing_date is None else missing_date
+                    values = row[1:date_column + 1] + (date_display,) + row[date_column + 1:]
+                rows.append((i, values, row_tags(values) if row_tags else ()))
+        return rows
+
+    def _filter_in_background(self, name, compute_rows):
+        """Build a search's rows on the filter thread; only the inserts run on the UI thread"""
+        seq = self._filter_seqs.get(name, 0) + 1
+        self._filter_seqs[name] = seq
+        # The records this search reads; a later load or sort starts a newer search
+        records = getattr(self, f"{name}_data", None)
+        
+        def compute():
+            if seq != self._filter_seqs.get(name):
+                return  # Superseded while queued behind another search
+            try:
+                rows = compute_rows()
+            except Exception as e:
+                print(f"Error filtering {name}: {e}")
+                return
+            self.after(0, self._apply_filter_rows, name, seq, records, rows)
+        
+        self._filter_executor.submit(compute)
+
+    def _apply_filter_rows(self, name, seq, records, rows):
+        """Show rows from a search unless a newer search of the same table has started"""
+        if seq != self._filter_seqs.get(name):
+            return
+        self._shown_records[name] = records
+        self._populate_tree(getattr(self, f"{name}_tree"), rows)
+
+    def _populate_tree(self, tree, rows):
+        """Replace a tree's rows, inserting the first page now and streaming the rest"""
+        pending = self._tree_fill_jobs.pop(str(tree), None)
+        if pending:
+            self.after_cancel(pending)
+        
+        # One Tcl call clears the table; skip it when there is nothing to clear
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        self._insert_tree_rows(tree, rows, 0, _TREE_FIRST_PAGE)
+
+    def _insert_tree_rows(self, tree, rows, start, count):
+        """Insert rows[start:start + count] and schedule the next batch"""
+        end = min(start + count, len(rows))
+        # Tags go in with the row, so each row costs a single Tcl call
+        insert = tree.insert
+        for text, values, tags in rows[start:end]:
+            # The record index doubles as the item id, so selections map straight to records
+            insert("", "end", iid=text, text=text, values=values, tags=tags)
+        
+        if end < len(rows):
+            # Yield to the event loop so the table stays scrollable while it fills
+            self._tree_fill_jobs[str(tree)] = self.after(
+                1, self._insert_tree_rows, tree, rows, end, _TREE_BATCH_SIZE)
+        else:
+            self._tree_fill_jobs.pop(str(tree), None)
+
     def setup_sms_table(self):
         # Create frame for search controls
         search_frame = ctk.CTkFrame(self.tab_sms)
@@ -914,6 +1834,7 @@ class App(ctk.CTk):
         
         self.sms_search_entry = ctk.CTkEntry(search_frame, width=250)
         self.sms_search_entry.pack(side="left", padx=5, pady=5, fill="x", expand=True)
+        self._bind_search(self.sms_search_entry, self.filter_sms_results)
         
         # Add search button
         search_button = ctk.CTkButton(
@@ -961,6 +1882,10 @@ class App(ctk.CTk):
         self.sms_tree.heading("message", text="Message", anchor=tk.W)
         self.sms_tree.heading("attachment", text="Attachment", anchor=tk.W)
         
+        # Configure tags for coloring
+        self.sms_tree.tag_configure('incoming', background='#e6f2ff')  # Light blue for incoming
+        self.sms_tree.tag_configure('outgoing', background='#f0f0f0')  # Light gray for outgoing
+        
         # Add scrollbars for the table
         y_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.sms_tree.yview)
         x_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.sms_tree.xview)
@@ -992,91 +1917,54 @@ class App(ctk.CTk):
 
     def filter_sms_results(self, search_term):
         """Filter SMS results based on search term"""
-        # Clear the tree
-        for item in self.sms_tree.get_children():
-            self.sms_tree.delete(item)
+        if not hasattr(self, 'sms_tree'):
+            return  # Tab not built yet; it is filled when first opened
+        if self._filter_unchanged("sms", search_term):
+            return  # Already showing this search
         
-        # Configure tags for coloring
-        self.sms_tree.tag_configure('incoming', background='#e6f2ff')  # Light blue for incoming
-        self.sms_tree.tag_configure('outgoing', background='#f0f0f0')  # Light gray for outgoing
+        self._filter_in_background("sms", lambda: self._compute_sms_rows(search_term))
+
+    def _compute_sms_rows(self, search_term):
+        """Return (text, values, tags) for each SMS matching search_term"""
+        rows = []
         
         # If we have SMS data
-        if hasattr(self, 'sms_data') and self.sms_data:
-            # Debug first few messages
-            print(f"Total SMS records: {len(self.sms_data)}")
-            for i, msg in enumerate(self.sms_data[:3]):  # Print first 3 for debugging
-                # print(f"Debug SMS {i} keys: {msg.keys()}")
-                # print(f"Debug SMS {i} values: {msg}")
-                print("SMS is being filtered")
+        if self.sms_data:
+            logging.debug("Filtering %d SMS records", len(self.sms_data))
                 
             search_term = search_term.lower()
             
+            matches = self._search_matches("sms", search_term)
+            
+            # Locals for the row loop
+            data = self.sms_data
+            convert = self.convert_timestamp
+            append = rows.append
+            
             # Add filtered items
-            for i, msg in enumerate(self.sms_data):
-                # Get attachment data with better detection
-                attachment = ""
-    
-                # First check if we have an attachment count > 0
-                if 'Attachment Count' in msg and msg['Attachment Count'] and int(float(str(msg['Attachment Count']).replace(',', ''))) > 0:
-                    attachment_count = int(float(str(msg['Attachment Count']).replace(',', '')))
-    
-                    # If we have names, show them
-                    if 'Attachment Names' in msg and msg['Attachment Names']:
-                        attachment = f"{attachment_count} file(s): {msg['Attachment Names']}"
-                    # Otherwise just show the count
-                    else:
-                        attachment = f"{attachment_count} attachment(s)"
-                # Fall back to other attachment fields
-                elif 'Attachment Names' in msg and msg['Attachment Names']:
-                    attachment = msg['Attachment Names']
-                elif 'Attachment Files' in msg and msg['Attachment Files']:
-                    attachment = msg['Attachment Files']
-                elif 'attachment' in msg and msg['attachment']:
-                    attachment = msg['attachment']
-                
-                # Fix service display
-                service = msg.get('service', '')
-                if not service or service == 'None':
-                    if 'direction' in msg and msg['direction'] == 'Sent':
-                        service = 'iMessage'  # Default for sent messages
-                    elif 'Message Service' in msg:
-                        service = msg['Message Service']
-                
-                # Check if search term exists in any field
-                if (search_term in str(msg.get('date', '')).lower() or
-                    search_term in str(msg.get('direction', '')).lower() or
-                    search_term in str(msg.get('phone_number', '')).lower() or
-                    search_term in str(service).lower() or
-                    search_term in str(msg.get('message', '')).lower() or
-                    search_term in str(attachment).lower()):
-                    
-                    # Get message content with combined text
-                    message = msg.get('message', '')
-                    if not message:
-                        # Try other possible field names
-                        if 'Sent' in msg and msg['Sent']:
-                            message = msg['Sent']
-                        elif 'Received' in msg and msg['Received']:
-                            message = msg['Received']
-                    date_display = self.convert_timestamp(msg.get('date', ''))
-        
-                    values = (
-                        date_display,  # Now timezone-adjusted
-                        msg.get('direction', ''),
-                        msg.get('phone_number', ''),
-                        service,  # Use the fixed service
-                        message,
-                        attachment  # Use the found attachment value
-                    )
-                    
-                    item_id = self.sms_tree.insert("", "end", text=i, values=values)
-                    
-                    # Apply color based on direction
-                    direction = msg.get('direction', '').lower()
-                    if 'received' in direction:
-                        self.sms_tree.item(item_id, tags=('incoming',))
-                    elif 'sent' in direction:
-                        self.sms_tree.item(item_id, tags=('outgoing',))
+            for i in matches:
+                date, direction, phone_number, service, message, attachment = _SMS_ROW(data[i])
+                
+                values = (
+                    convert(date),  # Now timezone-adjusted
+                    direction,
+                    phone_number,
+                    service,  # Use the fixed service
+                    message,
+                    attachment  # Use the found attachment value
+                )
+                
+                # Apply color based on direction
+                direction = direction.lower()
+                if 'received' in direction:
+                    tags = ('incoming',)
+                elif 'sent' in direction:
+                    tags = ('outgoing',)
+                else:
+                    tags = ()
+                append((i, values, tags))  # The index is the row text; the message view looks it up
+        
+        return rows
 
     def setup_calls_table(self):
         """Set up the call history table with search functionality"""
@@ -1090,6 +1978,7 @@ class App(ctk.CTk):
         
         self.calls_search_entry = ctk.CTkEntry(search_frame, width=250)
         self.calls_search_entry.pack(side="left", padx=5, pady=5, fill="x", expand=True)
+        self._bind_search(self.calls_search_entry, self.filter_call_results)
         
         # Add search button
         search_button = ctk.CTkButton(
@@ -1149,172 +2038,65 @@ class App(ctk.CTk):
 
     def filter_call_results(self, search_term):
         """Filter call history results based on search term"""
-        # Clear the tree
-        for item in self.calls_tree.get_children():
-            self.calls_tree.delete(item)
+        if not hasattr(self, 'calls_tree'):
+            return  # Tab not built yet; it is filled when first opened
+        if self._filter_unchanged("calls", search_term):
+            return  # Already showing this search
         
-        # Configure tags for coloring
-        self.calls_tree.tag_configure('incoming', background='#e6f2ff')  # Light blue for incoming
-        self.calls_tree.tag_configure('outgoing', background='#f0f0f0')  # Light gray for outgoing
+        self._filter_in_background("calls", lambda: self._compute_call_rows(search_term))
+
+    def _compute_call_rows(self, search_term):
+        """Return (text, values, tags) for each call matching search_term"""
+        rows = []
         
         # If we have call history data
-        if hasattr(self, 'calls_data') and self.calls_data:
+        if self.calls_data:
             search_term = search_term.lower()
             
+            matches = self._search_matches("calls", search_term)
+            
+            # Locals for the row loop
+            data = self.calls_data
+            convert = self.convert_timestamp
+            append = rows.append
+            
             # Add filtered items
-            for i, call in enumerate(self.calls_data):
-                # Check if search term exists in any field
-                if (search_term in str(call.get('date', '')).lower() or
-                    search_term in str(call.get('duration', '')).lower() or
-                    search_term in str(call.get('phone_number', '')).lower() or
-                    search_term in str(call.get('direction', '')).lower() or
-                    search_term in str(call.get('answered', '')).lower() or
-                    search_term in str(call.get('call_type', '')).lower()):
-                    
-                    # Convert timestamp for display
-                    date_display = self.convert_timestamp(call.get('date', ''))
-                    
-                    values = (
-                        date_display,  # Now with timezone conversion
-                        call.get('duration', ''),
-                        call.get('phone_number', ''),
-                        call.get('direction', ''),
-                        call.get('answered', ''),
-                        call.get('call_type', '')
-                    )
-                    
-                    item_id = self.calls_tree.insert("", "end", text=i, values=values)
-                    
-                    # Apply color based on direction
-                    direction = call.get('direction', '').lower()
-                    if 'incoming' in direction:
-                        self.calls_tree.item(item_id, tags=('incoming',))
-                    elif 'outgoing' in direction:
-                        self.calls_tree.item(item_id, tags=('outgoing',))
+            for i in matches:
+                call = data[i]
+                get = call.get
+                direction = get('direction', '')
+                
+                values = (
+                    convert(get('date', '')),  # Now with timezone conversion
+                    get('duration', ''),
+                    get('phone_number', ''),
+                    direction,
+                    get('answered', ''),
+                    get('call_type', '')
+                )
+                
+                # Apply color based on direction
+                direction = direction.lower()
+                if 'incoming' in direction:
+                    tags = ('incoming',)
+                elif 'outgoing' in direction:
+                    tags = ('outgoing',)
+                else:
+                    tags = ()
+                append((i, values, tags))
+        
+        return rows
 
     def setup_safari_table(self):
         """Set up the Safari history table with search functionality"""
-        # Create frame for search controls
-        search_frame = ctk.CTkFrame(self.tab_safari)
-        search_frame.pack(fill="x", padx=10, pady=5)
-        
-        # Add search label and entry
-        search_label = ctk.CTkLabel(search_frame, text="Search:")
-        search_label.pack(side="left", padx=5, pady=5)
-        
-        self.safari_search_entry = ctk.CTkEntry(search_frame, width=250)
-        self.safari_search_entry.pack(side="left", padx=5, pady=5, fill="x", expand=True)
-        
-        # Add search button
-        search_button = ctk.CTkButton(
-            search_frame, text="Search", 
-            command=lambda: self.filter_safari_results(self.safari_search_entry.get())
-        )
-        search_button.pack(side="left", padx=5, pady=5)
-        
-        # Add clear button
-        clear_button = ctk.CTkButton(
-            search_frame, text="Clear", 
-            command=lambda: [self.safari_search_entry.delete(0, tk.END), self.filter_safari_results("")]
-        )
-        clear_button.pack(side="left", padx=5, pady=5)
-        
-        # Create frame for table
-        table_frame = ctk.CTkFrame(self.tab_safari)
-        table_frame.pack(fill="both", expand=True, padx=10, pady=5)
-        
-        # Create Treeview for Safari history
-        self.safari_tree = ttk.Treeview(table_frame)
-        
-        # Define columns based on the expected data structure
-        self.safari_tree["columns"] = ("date", "title", "url", "loaded", "visit_count")
-        
-        # Format columns
-        self.safari_tree.column("#0", width=0, stretch=tk.NO)  # Hide the first column
-        self.safari_tree.column("date", anchor=tk.W, width=150)
-        self.safari_tree.column("title", anchor=tk.W, width=200)
-        self.safari_tree.column("url", anchor=tk.W, width=300)
-        self.safari_tree.column("loaded", anchor=tk.W, width=80)
-        self.safari_tree.column("visit_count", anchor=tk.E, width=100)
-        
-        # Create headings
-        self.safari_tree.heading("#0", text="", anchor=tk.W)
-        self.safari_tree.heading("date", text="Date Visited", anchor=tk.W)
-        self.safari_tree.heading("title", text="Page Title", anchor=tk.W)
-        self.safari_tree.heading("url", text="URL", anchor=tk.W)
-        self.safari_tree.heading("loaded", text="Page Loaded", anchor=tk.W)
-        self.safari_tree.heading("visit_count", text="Visit Count", anchor=tk.E)
-        
-        # Add scrollbars
-        y_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.safari_tree.yview)
-        x_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.safari_tree.xview)
-        self.safari_tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
-        
-        # Pack everything
-        y_scrollbar.pack(side="right", fill="y")
-        x_scrollbar.pack(side="bottom", fill="x")
-        self.safari_tree.pack(fill="both", expand=True)
+        self.safari_tree = self._build_table(self.tab_safari, "safari", self.filter_safari_results)
         
         # Bind double-click event to open URL
         self.safari_tree.bind("<Double-1>", self.open_safari_url)
 
     def filter_safari_results(self, search_term):
         """Filter Safari history results based on search term"""
-        # Clear the tree
-        for item in self.safari_tree.get_children():
-            self.safari_tree.delete(item)
-        
-        # If we have Safari history data
-        if hasattr(self, 'safari_data') and self.safari_data:
-            # Debug the first few records to see what date fields are available
-            if len(self.safari_data) > 0:
-                print(f"Safari data sample keys: {list(self.safari_data[0].keys())}")
-                for key in self.safari_data[0].keys():
-                    if 'date' in key.lower() or 'time' in key.lower():
-                        print(f"Potential date field: {key} = {self.safari_data[0][key]}")
-            
-            search_term = search_term.lower()
-            
-            # Add filtered items
-            for i, history_item in enumerate(self.safari_data):
-                # Check for various possible date keys 
-                date_value = None
-                for date_key in ['Date', 'date', 'Visit Date', 'visit_date', 'DateVisited', 'date_visited', 'Last Visited', 'last_visited', 'visit_time']:
-                    if date_key in history_item:
-                        date_value = history_item[date_key]
-                        break
-                
-                # If date not found with known keys, try to find any key containing 'date'
-                if not date_value:
-                    for key in history_item.keys():
-                        if 'date' in key.lower() or 'time' in key.lower():
-                            date_value = history_item[key]
-                            break
-                
-                # For debugging the raw date value
-                if i < 3:  # Only print first 3 records to avoid console spam
-                    print(f"Safari record {i} date value: '{date_value}'")
-                
-                # Check if search term exists in any field
-                if (search_term in str(date_value).lower() or
-                    search_term in str(history_item.get('Page Title', '')).lower() or
-                    search_term in str(history_item.get('URL', '')).lower() or
-                    search_term in str(history_item.get('Page Loaded', '')).lower() or
-                    search_term in str(history_item.get('Total Visit Count', '')).lower()):
-                    
-                    # Convert date for display
-                    date_display = self.convert_timestamp(date_value) if date_value else "Unknown Date"
-                    
-                    self.safari_tree.insert(
-                        "", "end", text=i,
-                        values=(
-                            date_display,
-                            history_item.get('Page Title', ''),
-                            history_item.get('URL', ''),
-                            history_item.get('Page Loaded', ''),
-                            history_item.get('Total Visit Count', '')
-                        )
-                    )
+        self._filter_table("safari", search_term)
 
     def open_safari_url(self, event):
         """Open the selected URL in the default web browser when double-clicked"""
@@ -1322,8 +2104,9 @@ class App(ctk.CTk):
             import webbrowser
             selected_items = self.safari_tree.selection()
             if selected_items:
-                item = selected_items[0]
-                url = self.safari_tree.item(item, "values")[2]  # URL is in the third column
+                # The item id indexes the records the table was filled from, so read the
+                # full URL from the record rather than the values tuple back from Tcl
+                url = self._shown_records["safari"][int(selected_items[0])].get('URL', '')
                 if url and url.startswith(("http://", "https://")):
                     webbrowser.open_new_tab(url)
         except Exception as e:
@@ -1331,435 +2114,40 @@ class App(ctk.CTk):
 
     def setup_contacts_table(self):
         """Set up the contacts table with search functionality"""
-        # Create frame for search controls
-        search_frame = ctk.CTkFrame(self.tab_contacts)
-        search_frame.pack(fill="x", padx=10, pady=5)
-        
-        # Add search label and entry
-        search_label = ctk.CTkLabel(search_frame, text="Search:")
-        search_label.pack(side="left", padx=5, pady=5)
-        
-        self.contacts_search_entry = ctk.CTkEntry(search_frame, width=250)
-        self.contacts_search_entry.pack(side="left", padx=5, pady=5, fill="x", expand=True)
-        
-        # Add search button
-        search_button = ctk.CTkButton(
-            search_frame, text="Search", 
-            command=lambda: self.filter_contacts_results(self.contacts_search_entry.get())
-        )
-        search_button.pack(side="left", padx=5, pady=5)
-        
-        # Add clear button
-        clear_button = ctk.CTkButton(
-            search_frame, text="Clear", 
-            command=lambda: [self.contacts_search_entry.delete(0, tk.END), self.filter_contacts_results("")]
-        )
-        clear_button.pack(side="left", padx=5, pady=5)
-        
-        # Create frame for table
-        table_frame = ctk.CTkFrame(self.tab_contacts)
-        table_frame.pack(fill="both", expand=True, padx=10, pady=5)
-        
-        # Create Treeview for contacts
-        self.contacts_tree = ttk.Treeview(table_frame)
-        
-        # Define columns
-        self.contacts_tree["columns"] = ("first_name", "last_name", "main_number", "mobile_number", "home_number", "work_number", "email")
-        
-        # Format columns
-        self.contacts_tree.column("#0", width=0, stretch=tk.NO)  # Hide the first column
-        self.contacts_tree.column("first_name", anchor=tk.W, width=100)
-        self.contacts_tree.column("last_name", anchor=tk.W, width=100)
-        self.contacts_tree.column("main_number", anchor=tk.W, width=120)
-        self.contacts_tree.column("mobile_number", anchor=tk.W, width=120)
-        self.contacts_tree.column("home_number", anchor=tk.W, width=120)
-        self.contacts_tree.column("work_number", anchor=tk.W, width=120)
-        self.contacts_tree.column("email", anchor=tk.W, width=200)
-        
-        # Create headings
-        self.contacts_tree.heading("#0", text="", anchor=tk.W)
-        self.contacts_tree.heading("first_name", text="First Name", anchor=tk.W)
-        self.contacts_tree.heading("last_name", text="Last Name", anchor=tk.W)
-        self.contacts_tree.heading("main_number", text="Main Number", anchor=tk.W)
-        self.contacts_tree.heading("mobile_number", text="Mobile", anchor=tk.W)
-        self.contacts_tree.heading("home_number", text="Home", anchor=tk.W)
-        self.contacts_tree.heading("work_number", text="Work", anchor=tk.W)
-        self.contacts_tree.heading("email", text="Email", anchor=tk.W)
-        
-        # Add scrollbars
-        y_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.contacts_tree.yview)
-        x_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.contacts_tree.xview)
-        self.contacts_tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
-        
-        # Pack everything
-        y_scrollbar.pack(side="right", fill="y")
-        x_scrollbar.pack(side="bottom", fill="x")
-        self.contacts_tree.pack(fill="both", expand=True)
+        self.contacts_tree = self._build_table(self.tab_contacts, "contacts", self.filter_contacts_results)
 
     def filter_contacts_results(self, search_term):
         """Filter contacts results based on search term"""
-        # Clear the tree
-        for item in self.contacts_tree.get_children():
-            self.contacts_tree.delete(item)
-        
-        # If we have contacts data
-        if hasattr(self, 'contacts_data') and self.contacts_data:
-            search_term = search_term.lower()
-            
-            # Add filtered items
-            for i, contact in enumerate(self.contacts_data):
-                # Check if search term exists in any field
-                if (search_term in str(contact.get('first_name', '')).lower() or
-                    search_term in str(contact.get('last_name', '')).lower() or
-                    search_term in str(contact.get('main_number', '')).lower() or
-                    search_term in str(contact.get('mobile_number', '')).lower() or
-                    search_term in str(contact.get('home_number', '')).lower() or
-                    search_term in str(contact.get('work_number', '')).lower() or
-                    search_term in str(contact.get('email', '')).lower()):
-                    
-                    self.contacts_tree.insert(
-                        "", "end", text=i,
-                        values=(
-                            contact.get('first_name', ''),
-                            contact.get('last_name', ''),
-                            contact.get('main_number', ''),
-                            contact.get('mobile_number', ''),
-                            contact.get('home_number', ''),
-                            contact.get('work_number', ''),
-                            contact.get('email', '')
-                        )
-                    )
+        self._filter_table("contacts", search_term)
 
     def setup_data_usage_table(self):
         """Set up the data usage table with search functionality"""
-        # Create frame for search controls
-        search_frame = ctk.CTkFrame(self.tab_data_usage)
-        search_frame.pack(fill="x", padx=10, pady=5)
-        
-        # Add search label and entry
-        search_label = ctk.CTkLabel(search_frame, text="Search:")
-        search_label.pack(side="left", padx=5, pady=5)
-        
-        self.data_usage_search_entry = ctk.CTkEntry(search_frame, width=250)
-        self.data_usage_search_entry.pack(side="left", padx=5, pady=5, fill="x", expand=True)
-        
-        # Add search button
-        search_button = ctk.CTkButton(
-            search_frame, text="Search", 
-            command=lambda: self.filter_data_usage_results(self.data_usage_search_entry.get())
-        )
-        search_button.pack(side="left", padx=5, pady=5)
-        
-        # Add clear button
-        clear_button = ctk.CTkButton(
-            search_frame, text="Clear", 
-            command=lambda: [self.data_usage_search_entry.delete(0, tk.END), self.filter_data_usage_results("")]
-        )
-        clear_button.pack(side="left", padx=5, pady=5)
-        
-        # Create frame for table
-        table_frame = ctk.CTkFrame(self.tab_data_usage)
-        table_frame.pack(fill="both", expand=True, padx=10, pady=5)
-        
-        # Create Treeview for data usage
-        self.data_usage_tree = ttk.Treeview(table_frame)
-        
-        # Define columns based on the expected data structure
-        self.data_usage_tree["columns"] = ("date", "app_name", "cell_in", "cell_out")
-        
-        # Format columns
-        self.data_usage_tree.column("#0", width=0, stretch=tk.NO)  # Hide the first column
-        self.data_usage_tree.column("date", anchor=tk.W, width=150)
-        self.data_usage_tree.column("app_name", anchor=tk.W, width=200)
-        self.data_usage_tree.column("cell_in", anchor=tk.E, width=100)
-        self.data_usage_tree.column("cell_out", anchor=tk.E, width=100)
-        
-        # Create headings
-        self.data_usage_tree.heading("#0", text="", anchor=tk.W)
-        self.data_usage_tree.heading("date", text="Date", anchor=tk.W)
-        self.data_usage_tree.heading("app_name", text="Application", anchor=tk.W)
-        self.data_usage_tree.heading("cell_in", text="Cell In (KB)", anchor=tk.E)
-        self.data_usage_tree.heading("cell_out", text="Cell Out (KB)", anchor=tk.E)
-        
-        # Add scrollbars
-        y_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.data_usage_tree.yview)
-        x_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.data_usage_tree.xview)
-        self.data_usage_tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
-        
-        # Pack everything
-        y_scrollbar.pack(side="right", fill="y")
-        x_scrollbar.pack(side="bottom", fill="x")
-        self.data_usage_tree.pack(fill="both", expand=True)
+        self.data_usage_tree = self._build_table(self.tab_data_usage, "data_usage", self.filter_data_usage_results)
 
     def filter_data_usage_results(self, search_term):
         """Filter data usage results based on search term"""
-        # Clear the tree
-        for item in self.data_usage_tree.get_children():
-            self.data_usage_tree.delete(item)
-        
-        # If we have data usage data
-        if hasattr(self, 'data_usage_data') and self.data_usage_data:
-            # Debug - print keys for first item to see available fields
-            if self.data_usage_data and len(self.data_usage_data) > 0:
-                print(f"Data usage keys: {list(self.data_usage_data[0].keys())}")
-                
-            search_term = search_term.lower()
-            
-            # Add filtered items
-            for i, usage in enumerate(self.data_usage_data):
-                # Find date field - check multiple possible field names
-                date_value = None
-                for field in ['Date (UTC)', 'Date', 'Time', 'Timestamp', 'date', 'timestamp', 'time']:
-                    if field in usage and usage[field]:
-                        date_value = usage[field]
-                        break
-                
-                # If not found yet, try any field containing 'date' or 'time'
-                if not date_value:
-                    for key in usage.keys():
-                        if ('date' in key.lower() or 'time' in key.lower()) and usage[key]:
-                            date_value = usage[key]
-                            break
-                
-                # Debug first few records
-                if i < 3:
-                    print(f"Data usage record {i}: Date value: {date_value}")
-                
-                # Check if search term exists in any field
-                if (search_term in str(date_value).lower() or
-                    search_term in str(usage.get('Application Bundle', '')).lower()):
-                    
-                    # Convert date for display
-                    date_display = self.convert_timestamp(date_value) if date_value else "Unknown Date"
-                    
-                    self.data_usage_tree.insert(
-                        "", "end", text=i,
-                        values=(
-                            date_display,  # Now timezone-adjusted or "Unknown Date"
-                            usage.get('Application Bundle', ''),
-                            usage.get('WWAN In (KB)', '0'),
-                            usage.get('WWAN Out (KB)', '0')
-                        )
-                    )
+        self._filter_table("data_usage", search_term)
 
     def setup_accounts_table(self):
         """Set up the accounts table with search functionality"""
-        # Create frame for search controls
-        search_frame = ctk.CTkFrame(self.tab_accounts)
-        search_frame.pack(fill="x", padx=10, pady=5)
-        
-        # Add search label and entry
-        search_label = ctk.CTkLabel(search_frame, text="Search:")
-        search_label.pack(side="left", padx=5, pady=5)
-        
-        self.accounts_search_entry = ctk.CTkEntry(search_frame, width=250)
-        self.accounts_search_entry.pack(side="left", padx=5, pady=5, fill="x", expand=True)
-        
-        # Add search button
-        search_button = ctk.CTkButton(
-            search_frame, text="Search", 
-            command=lambda: self.filter_accounts_results(self.accounts_search_entry.get())
-        )
-        search_button.pack(side="left", padx=5, pady=5)
-        
-        # Add clear button
-        clear_button = ctk.CTkButton(
-            search_frame, text="Clear", 
-            command=lambda: [self.accounts_search_entry.delete(0, tk.END), self.filter_accounts_results("")]
-        )
-        clear_button.pack(side="left", padx=5, pady=5)
-        
-        # Create frame for table
-        table_frame = ctk.CTkFrame(self.tab_accounts)
-        table_frame.pack(fill="both", expand=True, padx=10, pady=5)
-        
-        # Create Treeview for accounts
-        self.accounts_tree = ttk.Treeview(table_frame)
-        
-        # Define columns based on the expected data structure
-        self.accounts_tree["columns"] = ("date", "username", "description", "account_type", "service")
-        
-        # Format columns
-        self.accounts_tree.column("#0", width=0, stretch=tk.NO)  # Hide the first column
-        self.accounts_tree.column("date", anchor=tk.W, width=150)
-        self.accounts_tree.column("username", anchor=tk.W, width=200)
-        self.accounts_tree.column("description", anchor=tk.W, width=200)
-        self.accounts_tree.column("account_type", anchor=tk.W, width=100)
-        self.accounts_tree.column("service", anchor=tk.W, width=150)
-        
-        # Create headings
-        self.accounts_tree.heading("#0", text="", anchor=tk.W)
-        self.accounts_tree.heading("date", text="Date", anchor=tk.W)
-        self.accounts_tree.heading("username", text="Username", anchor=tk.W)
-        self.accounts_tree.heading("description", text="Description", anchor=tk.W)
-        self.accounts_tree.heading("account_type", text="Account Type", anchor=tk.W)
-        self.accounts_tree.heading("service", text="Service", anchor=tk.W)
-        
-        # Add scrollbars
-        y_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.accounts_tree.yview)
-        x_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.accounts_tree.xview)
-        self.accounts_tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
-        
-        # Pack everything
-        y_scrollbar.pack(side="right", fill="y")
-        x_scrollbar.pack(side="bottom", fill="x")
-        self.accounts_tree.pack(fill="both", expand=True)
+        self.accounts_tree = self._build_table(self.tab_accounts, "accounts", self.filter_accounts_results)
 
     def filter_accounts_results(self, search_term):
         """Filter accounts results based on search term"""
-        # Clear the tree
-        for item in self.accounts_tree.get_children():
-            self.accounts_tree.delete(item)
-        
-        # If we have accounts data
-        if hasattr(self, 'accounts_data') and self.accounts_data:
-            # Debug - print keys for first item to see available fields
-            if self.accounts_data and len(self.accounts_data) > 0:
-                print(f"Accounts keys: {list(self.accounts_data[0].keys())}")
-                
-            search_term = search_term.lower()
-            
-            # Add filtered items
-            for i, account in enumerate(self.accounts_data):
-                # Find date field - check multiple possible field names
-                date_value = None
-                for field in ['Account Date (UTC)', 'Account Date', 'Date', 'Time', 'Created', 'Modified',
-                             'creation_date', 'created_at', 'modified_at', 'timestamp']:
-                    if field in account and account[field]:
-                        date_value = account[field]
-                        break
-                
-                # If not found yet, try any field containing 'date' or 'time'
-                if not date_value:
-                    for key in account.keys():
-                        if ('date' in key.lower() or 'time' in key.lower()) and account[key]:
-                            date_value = account[key]
-                            break
-                
-                # Debug first few records
-                if i < 3:
-                    print(f"Accounts record {i}: Date value: {date_value}")
-                
-                # Check if search term exists in any field
-                if (search_term in str(date_value).lower() or
-                    search_term in str(account.get('Username', '')).lower() or
-                    search_term in str(account.get('Description', '')).lower() or
-                    search_term in str(account.get('Account Type', '')).lower() or
-                    search_term in str(account.get('Service', '')).lower()):
-                    
-                    # Convert date for display
-                    date_display = self.convert_timestamp(date_value) if date_value else "Unknown Date"
-                    
-                    self.accounts_tree.insert(
-                        "", "end", text=i,
-                        values=(
-                            date_display,  # Now timezone-adjusted or "Unknown Date"
-                            account.get('Username', ''),
-                            account.get('Description', ''),
-                            account.get('Account Type', ''),
-                            account.get('Service', '')
-                        )
-                    )
+        self._filter_table("accounts", search_term)
 
     def setup_permissions_table(self):
         """Set up the permissions table tab"""
-        # Create a search frame at the top
-        search_frame = ctk.CTkFrame(self.tab_permissions)
-        search_frame.pack(fill="x", padx=10, pady=5)
-        
-        search_label = ctk.CTkLabel(search_frame, text="Search:")
-        search_label.pack(side="left", padx=5, pady=5)
-        
-        self.permissions_search_entry = ctk.CTkEntry(search_frame, width=250)
-        self.permissions_search_entry.pack(side="left", padx=5, pady=5)
-        
-        # Add search button
-        search_button = ctk.CTkButton(
-            search_frame, text="Search", 
-            command=lambda: self.filter_permissions_results(self.permissions_search_entry.get())
-        )
-        search_button.pack(side="left", padx=5, pady=5)
-        
-        # Add clear button
-        clear_button = ctk.CTkButton(
-            search_frame, text="Clear", 
-            command=lambda: [self.permissions_search_entry.delete(0, tk.END), self.filter_permissions_results("")]
-        )
-        clear_button.pack(side="left", padx=5, pady=5)
-        
-        # Create frame for table
-        table_frame = ctk.CTkFrame(self.tab_permissions)
-        table_frame.pack(fill="both", expand=True, padx=10, pady=5)
-        
-        # Create Treeview for permissions - CREATE THE WIDGET FIRST
-        self.permissions_tree = ttk.Treeview(table_frame)
-        
-        # Define columns based on the expected data structure
-        self.permissions_tree["columns"] = ("app_name", "permission", "access_granted", "type", "description")
-        
-        # NOW configure columns AFTER the widget is created
-        self.permissions_tree.column("#0", width=0, stretch=tk.NO)  # Hide the first column
-        self.permissions_tree.column("app_name", anchor=tk.W, width=150)
-        self.permissions_tree.column("permission", anchor=tk.W, width=150)
-        self.permissions_tree.column("access_granted", anchor=tk.W, width=100)
-        self.permissions_tree.column("type", anchor=tk.W, width=100)
-        self.permissions_tree.column("description", anchor=tk.W, width=200)
-        
-        # Create headings
-        self.permissions_tree.heading("#0", text="", anchor=tk.W)
-        self.permissions_tree.heading("app_name", text="App Name", anchor=tk.W)
-        self.permissions_tree.heading("permission", text="Permission", anchor=tk.W)
-        self.permissions_tree.heading("access_granted", text="Access Granted", anchor=tk.W)
-        self.permissions_tree.heading("type", text="Type", anchor=tk.W)
-        self.permissions_tree.heading("description", text="Description", anchor=tk.W)
-        
-        # Add scrollbars
-        vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self.permissions_tree.yview)
-        hsb = ttk.Scrollbar(table_frame, orient="horizontal", command=self.permissions_tree.xview)
-        self.permissions_tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.permissions_tree = self._build_table(self.tab_permissions, "permissions", self.filter_permissions_results)
         
-        # Pack the Treeview and scrollbars
-        self.permissions_tree.pack(fill="both", expand=True)
-        vsb.pack(side="right", fill="y")
-        hsb.pack(side="bottom", fill="x")
+        # Configure tags for coloring by permission status
+        self.permissions_tree.tag_configure('granted', background='#e6ffe6')
+        self.permissions_tree.tag_configure('denied', background='#ffe6e6')
+        self.permissions_tree.tag_configure('unknown', background='#ffffe6')
 
     def filter_permissions_results(self, search_term):
         """Filter app permissions results based on search term"""
-        # Clear the tree
-        for item in self.permissions_tree.get_children():
-            self.permissions_tree.delete(item)
-        
-        # If we have permissions data
-        if hasattr(self, 'permissions_data') and self.permissions_data:
-            search_term = search_term.lower()
-            
-            # Add filtered items
-            for i, permission in enumerate(self.permissions_data):
-                # Check if search term exists in any field
-                if (search_term in str(permission.get('Device Permission', '')).lower() or
-                    search_term in str(permission.get('Application Bundle', '')).lower() or
-                    search_term in str(permission.get('Permission Status', '')).lower()):
-                    
-                    # Apply special styling based on status
-                    status = permission.get('Permission Status', '')
-                    
-                    values = (
-                        permission.get('Device Permission', ''),
-                        permission.get('Application Bundle', ''),
-                        permission.get('Permission Status', '')
-                    )
-                    item_id = self.permissions_tree.insert("", "end", text=i, values=values)
-                    
-                    # Optional: Add color highlighting based on permission status
-                    if 'granted' in status.lower():
-                        self.permissions_tree.tag_configure('granted', background='#e6ffe6')
-                        self.permissions_tree.item(item_id, tags=('granted',))
-                    elif 'denied' in status.lower():
-                        self.permissions_tree.tag_configure('denied', background='#ffe6e6')
-                        self.permissions_tree.item(item_id, tags=('denied',))
-                    else:
-                        self.permissions_tree.tag_configure('unknown', background='#ffffe6')
-                        self.permissions_tree.item(item_id, tags=('unknown',))
+        self._filter_table("permissions", search_term)
 
     def setup_photos_table(self):
         """Set up the photos analysis and thumbnail display"""
@@ -1775,106 +2163,11 @@ class App(ctk.CTk):
         self.photos_notebook.add(self.photo_thumbnails_tab, text="Thumbnails")
         
         # Add existing search frame and table to analysis tab
-        search_frame = ctk.CTkFrame(self.photo_analysis_tab)
-        search_frame.pack(fill="x", padx=10, pady=5)
-        
-        # Add search label and entry
-        search_label = ctk.CTkLabel(search_frame, text="Search:")
-        search_label.pack(side="left", padx=5, pady=5)
-        
-        self.photos_search_entry = ctk.CTkEntry(search_frame, width=250)
-        self.photos_search_entry.pack(side="left", padx=5, pady=5, fill="x", expand=True)
-        
-        # Add search button
-        search_button = ctk.CTkButton(
-            search_frame, text="Search", 
-            command=lambda: self.filter_photos_results(self.photos_search_entry.get())
-        )
-        search_button.pack(side="left", padx=5, pady=5)
-        
-        # Add clear button
-        clear_button = ctk.CTkButton(
-            search_frame, text="Clear", 
-            command=lambda: [self.photos_search_entry.delete(0, tk.END), self.filter_photos_results("")]
-        )
-        clear_button.pack(side="left", padx=5, pady=5)
-        
-        # Add this in setup_photos_table method, near other buttons
-        # test_button = ctk.CTkButton(
-        #     search_frame, 
-        #     text="Test Thumbnails", 
-        #     command=self.test_photo_display
-        # )
-        # test_button.pack(side="left", padx=5, pady=5)
-        
-        # Create frame for table
-        table_frame = ctk.CTkFrame(self.photo_analysis_tab)
-        table_frame.pack(fill="both", expand=True, padx=10, pady=5)
-        
-        # Create Treeview for photos
-        self.photos_tree = ttk.Treeview(table_frame)
-        
-        # Define columns based on the expected data structure
-        self.photos_tree["columns"] = ("filename", "path", "date_taken", "classification", "confidence")
-        
-        # Format columns
-        self.photos_tree.column("#0", width=0, stretch=tk.NO)  # Hide the first column
-        self.photos_tree.column("filename", anchor=tk.W, width=150)
-        self.photos_tree.column("path", anchor=tk.W, width=250)
-        self.photos_tree.column("date_taken", anchor=tk.W, width=150)
-        self.photos_tree.column("classification", anchor=tk.W, width=150)
-        self.photos_tree.column("confidence", anchor=tk.E, width=100)
-        
-        # Create headings
-        self.photos_tree.heading("#0", text="", anchor=tk.W)
-        self.photos_tree.heading("filename", text="Filename", anchor=tk.W)
-        self.photos_tree.heading("path", text="Path", anchor=tk.W)
-        self.photos_tree.heading("date_taken", text="Date Taken", anchor=tk.W)
-        self.photos_tree.heading("classification", text="Classification", anchor=tk.W)
-        self.photos_tree.heading("confidence", text="Confidence", anchor=tk.E)
-        
-        # Add scrollbars
-        y_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.photos_tree.yview)
-        x_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.photos_tree.xview)
-        self.photos_tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
-        
-        # Pack everything
-        y_scrollbar.pack(side="right", fill="y")
-        x_scrollbar.pack(side="bottom", fill="x")
-        self.photos_tree.pack(fill="both", expand=True)
+        self.photos_tree = self._build_table(self.photo_analysis_tab, "photos", self.filter_photos_results)
 
     def filter_photos_results(self, search_term):
         """Filter photo analysis results based on search term"""
-        # Clear the tree
-        for item in self.photos_tree.get_children():
-            self.photos_tree.delete(item)
-        
-        # If we have photos data
-        if hasattr(self, 'photos_data') and self.photos_data:
-            search_term = search_term.lower()
-            
-            # Add filtered items
-            for i, photo in enumerate(self.photos_data):
-                # Check if search term exists in any field
-                if (search_term in str(photo.get('Filename', '')).lower() or
-                    search_term in str(photo.get('Path', '')).lower() or
-                    search_term in str(photo.get('Date Taken', '')).lower() or
-                    search_term in str(photo.get('Scene Classification', '')).lower()):
-                    
-                    # Convert date for display
-                    date_taken_display = self.convert_timestamp(photo.get('Date Taken', ''))
-                    date_added_display = self.convert_timestamp(photo.get('Date Added', ''))
-                    
-                    self.photos_tree.insert(
-                        "", "end", text=i,
-                        values=(
-                            photo.get('Filename', ''),
-                            photo.get('Path', ''),
-                            date_taken_display,  # Now timezone-adjusted
-                            photo.get('Scene Classification', ''),
-                            photo.get('Confidence', '')
-                        )
-                    )
+        self._filter_table("photos", search_term)
 
     def toggle_taxonomy_dropdown(self):
         """Enable or disable the taxonomy dropdown based on checkbox state"""
@@ -1886,12 +2179,9 @@ class App(ctk.CTk):
             self.taxonomy_label.configure(state="disabled")
 
     def get_taxonomy_options(self):
-        # Extract all unique values from the taxonomy dictionary
-        taxonomy_values = set(parse_ios_backup.taxonomy_Dict.values())
-        # Sort them alphabetically for better user experience
-        sorted_values = sorted(list(taxonomy_values))
-        # Add an "All Photos" option at the top
-        return [" "] + sorted_values
+        # Unique taxonomy values, sorted alphabetically for better user experience,
+        # with an "All Photos" option at the top
+        return [" "] + sorted(set(parse_ios_backup.taxonomy_Dict.values()))
 
     def setup_notes_table(self):
         """Set up the notes table with search functionality"""
@@ -1905,6 +2195,7 @@ class App(ctk.CTk):
         
         self.notes_search_entry = ctk.CTkEntry(search_frame, width=250)
         self.notes_search_entry.pack(side="left", padx=5, pady=5, fill="x", expand=True)
+        self._bind_search(self.notes_search_entry, self.filter_notes_results)
         
         # Add search button
         search_button = ctk.CTkButton(
@@ -1928,7 +2219,7 @@ class App(ctk.CTk):
         self.notes_text = ctk.CTkTextbox(table_frame, wrap="word")
         
         # Configure tags for different styles - FIX: use absolute sizes instead of relative
-        title_font = ctk.CTkFont(size=14, weight="bold")
+        title_font = self._font_btn
         header_font = ctk.CTkFont(size=13, weight="bold")
         
         self.notes_text._textbox.tag_configure("title", font=title_font, foreground="#2a6099")
@@ -1936,66 +2227,32 @@ class App(ctk.CTk):
         self.notes_text._textbox.tag_configure("note_odd", background="#f5f8fc", spacing1=10, spacing2=2, spacing3=10)
         self.notes_text._textbox.tag_configure("note_even", background="#ffffff", spacing1=10, spacing2=2, spacing3=10) 
         self.notes_text._textbox.tag_configure("separator", foreground="#cccccc")
+        self.notes_text._textbox.tag_configure("show_more", foreground="#2a6099", underline=True)
+        self.notes_text._textbox.tag_bind("show_more", "<Button-1>", lambda event: self._append_notes_page())
         
         # Pack the text widget
         self.notes_text.pack(fill="both", expand=True)
 
     def filter_notes_results(self, search_term):
         """Filter notes results based on search term with enhanced styling"""
+        if not hasattr(self, 'notes_text'):
+            return  # Tab not built yet; it is filled when first opened
+        if self._filter_unchanged("notes", search_term):
+            return  # Already showing this search
+        
         # Clear the text widget
         self.notes_text.delete("1.0", tk.END)
         
-        # Debug output
-        self.update_parse_status(f"Searching notes for: '{search_term}'")
-        
-        # If we have notes data
-        if hasattr(self, 'notes_data') and self.notes_data:
-            self.update_parse_status(f"Found {len(self.notes_data)} notes to search")
+        # If we have notes data; the status line is set once, with the outcome
+        if self.notes_data:
             search_term = search_term.lower()
             
-            # Display filtered notes with alternating backgrounds
-            displayed_count = 0
-            for i, note in enumerate(self.notes_data):
-                if i == 0:
-                    print(f"Note keys: {note.keys()}")
-                
-                # Try different possible keys for note content
-                content = ""
-                for possible_key in ['ZCONTENT', 'content', 'Content', 'text', 'Text', 'body', 'Body', 'note_content']:
-                    if possible_key in note:
-                        content = str(note.get(possible_key, ''))
-                        break
-                
-                # If still no content found, try to use the entire note
-                if not content and isinstance(note, dict):
-                    content = str(note)
-                
-                # Apply search filter if specified
-                if not search_term or search_term in content.lower():
-                    # Determine style based on odd/even
-                    note_tag = "note_odd" if displayed_count % 2 == 1 else "note_even"
-                    
-                    # Add note header with note number
-                    self.notes_text.insert(tk.END, f"Note {displayed_count + 1}", "note_header")
-                    
-                    # Add creation date if available with timezone conversion
-                    for date_key in ['ZCREATIONDATE', 'creation_date', 'date', 'timestamp']:
-                        if date_key in note:
-                            creation_date = note.get(date_key, '')
-                            # Convert timestamp for timezone display
-                            creation_date_display = self.convert_timestamp(creation_date)
-                            self.notes_text.insert(tk.END, f" • {creation_date_display}", "note_header")
-                            break
-                    
-                    self.notes_text.insert(tk.END, "\n\n", note_tag)
-                    
-                    # Insert the content with proper formatting
-                    self.notes_text.insert(tk.END, content + "\n\n", note_tag)
-                    
-                    # Add a stylish separator
-                    self.notes_text.insert(tk.END, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n", "separator")
-                    
-                    displayed_count += 1
+            logging.debug("Note keys: %s", self.notes_data[0].keys())
+            # Show the first page of matches; the footer appends further pages
+            self._notes_matches = self._search_matches("notes", search_term)
+            self._notes_shown = 0
+            self._append_notes_page()
+            displayed_count = len(self._notes_matches)
             
             # Show summary
             if displayed_count > 0:
@@ -2007,134 +2264,83 @@ class App(ctk.CTk):
             self.notes_text.insert(tk.END, "No notes data available", "title")
             self.update_parse_status("No notes data available")
 
-    def setup_treeview_sorting(self):
-        """Set up sorting functionality for all treeview tables"""
-        # Add this to the end of your __init__ method
+    def _append_notes_page(self):
+        """Append the next page of matching notes, ending with a footer while more remain"""
+        textbox = self.notes_text._textbox
+        footer = textbox.tag_ranges("show_more")
+        if footer:
+            textbox.delete(*footer)
         
-        # Define sort state variables
-        self.sms_sort_column = None
-        self.sms_sort_reverse = False
+        matches = self._notes_matches
+        start = self._notes_shown
+        end = min(start + _NOTES_PAGE_SIZE, len(matches))
+        display = self._display_rows("notes")
         
-        self.calls_sort_column = None
-        self.calls_sort_reverse = False
-        
-        self.contacts_sort_column = None
-        self.contacts_sort_reverse = False
+        # Display filtered notes with alternating backgrounds, as alternating
+        # text and tags inserted with a single Text call below
+        parts = []
+        for number in range(start, end):
+            creation_date, content = display[matches[number]]
+            
+            # Determine style based on odd/even
+            note_tag = "note_odd" if number % 2 == 1 else "note_even"
+            
+            # Add note header with note number and creation date if available
+            header = f"Note {number + 1}"
+            if creation_date is not None:
+                header += f" • {self.convert_timestamp(creation_date)}"
+            
+            parts += (header, "note_header",
+                      "\n\n" + content + "\n\n", note_tag,
+                      _NOTE_SEPARATOR, "separator")
         
-        self.data_usage_sort_column = None
-        self.data_usage_sort_reverse = False
+        remaining = len(matches) - end
+        if remaining:
+            parts += (f"Show more ({remaining} remaining)\n", ("note_header", "show_more"))
         
-        self.accounts_sort_column = None
-        self.accounts_sort_reverse = False
+        if parts:
+            textbox.insert(tk.END, *parts)
+        self._notes_shown = end
+
+    def setup_treeview_sorting(self):
+        """Set up sorting functionality for all treeview tables"""
+        # Add this to the end of your __init__ method
         
-        self.permissions_sort_column = None
-        self.permissions_sort_reverse = False
+        # Table name -> (sorted column, descending)
+        self._sort_state = {}
         
-        self.photos_sort_column = None
-        self.photos_sort_reverse = False
+        # Bind click events to column headers of tables that are already built
+        for name in ["sms", "calls", "contacts", "data_usage", "accounts",
+                     "permissions", "photos", "interactions", "safari"]:
+            if hasattr(self, f"{name}_tree"):
+                self._bind_sort_headings(name)
 
-        self.safari_sort_column = None  
-        self.safari_sort_reverse = False
-        
-        # Bind click events to column headers
-        for tree, name in [
-            (self.sms_tree, "sms"),
-            (self.calls_tree, "calls"),
-            (self.contacts_tree, "contacts"),
-            (self.data_usage_tree, "data_usage"),
-            (self.accounts_tree, "accounts"),
-            (self.permissions_tree, "permissions"),
-            (self.photos_tree, "photos"),
-            (self.interactions_tree, "interactions"),
-            (self.safari_tree, "safari")
-        ]:
-            for col in tree["columns"]:
-                tree.heading(col, command=lambda _col=col, _name=name: self.treeview_sort_column(_name, _col))
+    def _bind_sort_headings(self, name):
+        """Make each column header of a results table sort it when clicked"""
+        tree = getattr(self, f"{name}_tree")
+        for col in tree["columns"]:
+            tree.heading(col, command=lambda _col=col, _name=name: self.treeview_sort_column(_name, _col))
 
     def treeview_sort_column(self, tree_name, col):
         """Sort treeview contents when a column header is clicked"""
-        # Get the appropriate tree and data variables
-        tree_map = {
-            "sms": (self.sms_tree, "sms_data"),
-            "calls": (self.calls_tree, "calls_data"),
-            "interactions": (self.interactions_tree, "interactions_data"),
-            "contacts": (self.contacts_tree, "contacts_data"),
-            "data_usage": (self.data_usage_tree, "data_usage_data"),
-            "accounts": (self.accounts_tree, "accounts_data"),
-            "permissions": (self.permissions_tree, "permissions_data"),
-            "photos": (self.photos_tree, "photos_data"),
-            "safari": (self.safari_tree, "safari_data")
-        }
-        
-        tree, data_attr = tree_map[tree_name]
-        data = getattr(self, data_attr, [])
-        
-        # Handle sort state
-        sort_col_var = f"{tree_name}_sort_column"
-        sort_reverse_var = f"{tree_name}_sort_reverse"
-        
-        current_col = getattr(self, sort_col_var, None)
-        current_reverse = getattr(self, sort_reverse_var, False)
+        # Get the appropriate tree and data
+        tree = getattr(self, f"{tree_name}_tree")
+        data = getattr(self, f"{tree_name}_data", [])
         
         # Toggle sort direction if clicking same column
-        if current_col == col:
-            setattr(self, sort_reverse_var, not current_reverse)
-        else:
-            setattr(self, sort_col_var, col)
-            setattr(self, sort_reverse_var, False)
+        current_col, current_reverse = self._sort_state.get(tree_name, (None, False))
+        reverse = not current_reverse if current_col == col else False
+        self._sort_state[tree_name] = (col, reverse)
         
-        reverse = getattr(self, sort_reverse_var)
-        
-        # Update sort indicator in header
-        for c in tree["columns"]:
-            tree.heading(c, text=tree.heading(c, "text").replace(" ↑", "").replace(" ↓", ""))
+        # Update sort indicator in header; only the previously sorted column has an arrow
+        if current_col is not None and current_col != col:
+            tree.heading(current_col, text=tree.heading(current_col, "text").rstrip(" ↑↓"))
         
         arrow = " ↑" if not reverse else " ↓"
-        tree.heading(col, text=tree.heading(col, "text") + arrow)
-        
-        # Create mapping for column IDs to actual data field names
-        column_mappings = {
-            "sms": {
-                "date": "Date",
-                "contact": "Contact",
-                "service": "Message Service"
-            },
-            "calls": {
-                "date": "Date",
-                "phone_number": "Phone Number"
-            },
-            "data_usage": {
-                "date": "Date",
-                "app_name": "Application Bundle",
-                "cell_in": "Cell In (KB)", 
-                "cell_out": "Cell Out (KB)"
-            },
-            "accounts": {
-                "date": "Date",
-                "username": "Username",
-                "description": "Description",
-            },
-            "permissions": {
-                "permission": "Device Permission",
-                "app_bundle": "Application Bundle",
-                "status": "Permission Status"
-            },
-            "interactions": {
-                "date": "Date",
-                "service": "Service",
-                "contact": "Contact Display Name",
-                "app": "Application ID",
-                "direction": "Direction",
-                "count": "Interaction Count",
-                "last_contact": "Last Contacted (UTC)",
-                "content_type": "Content Type"
-            }
-        }
+        tree.heading(col, text=tree.heading(col, "text").rstrip(" ↑↓") + arrow)
         
         # Get the field name to sort by
-        field_name = col
-        if tree_name in column_mappings and col in column_mappings[tree_name]:
-            field_name = column_mappings[tree_name][col]
+        field_name = _SORT_FIELDS.get(tree_name, {}).get(col, col)
         
         # Get search term
         search_term = ""
@@ -2153,12 +2359,10 @@ class App(ctk.CTk):
         
         def do_sort():
             try:
-                # Simple string-based sorting for ALL columns
-                sorted_list = sorted(
-                    thread_data,
-                    key=lambda x: str(x.get(thread_field, '')).lower(),
-                    reverse=thread_reverse
-                )
+                # Compute every key up front, then order the records by them
+                keys = _sort_keys(thread_data, thread_field)
+                order = sorted(range(len(keys)), key=keys.__getitem__, reverse=thread_reverse)
+                sorted_list = [thread_data[i] for i in order]
                 
                 # Update UI on main thread
                 self.after(10, lambda: self._update_sorted_data(tree_name, sorted_list, search_term))
@@ -2167,11 +2371,12 @@ class App(ctk.CTk):
                 print(f"Sorting error: {e}")
                 self.after(10, lambda: self.parse_status_text.configure(text="Error during sorting"))
         
-        # Start thread
-        import threading
-        thread = threading.Thread(target=do_sort)
-        thread.daemon = True
-        thread.start()
+        # Drop this table's previous sort if it has not started yet; the single
+        # worker applies the remaining sorts in click order
+        pending = self._sort_futures.get(tree_name)
+        if pending is not None:
+            pending.cancel()
+        self._sort_futures[tree_name] = self._sort_executor.submit(do_sort)
 
     def _update_sorted_data(self, tree_name, sorted_data, search_term):
         """Update the data and refresh the display"""
@@ -2186,7 +2391,9 @@ class App(ctk.CTk):
             "data_usage": self.filter_data_usage_results,
             "accounts": self.filter_accounts_results,
             "permissions": self.filter_permissions_results,
-            "photos": self.filter_photos_results
+            "photos": self.filter_photos_results,
+            "safari": self.filter_safari_results,
+            "interactions": self.filter_interactions_results
         }
         
         if tree_name in filter_funcs:
@@ -2197,34 +2404,31 @@ class App(ctk.CTk):
     def update_sms_message_display(self, event):
         """Update the message display with the selected message content"""
         selected_items = self.sms_tree.selection()
-        if selected_items:
-            item = selected_items[0]
-            item_id = self.sms_tree.item(item, "text")  # Get the index
-            
-            # Get the message content
-            if hasattr(self, 'sms_data') and self.sms_data and int(item_id) < len(self.sms_data):
-                msg = self.sms_data[int(item_id)]
-                
-                # Clear the text box
-                self.sms_message_display.delete("1.0", tk.END)
-                
-                # Add message details
-                direction = msg.get('direction', '')
-                contact = msg.get('phone_number', '')
-                date = msg.get('date', '')
-                service = msg.get('service', '')
-                message = msg.get('Sent', '') or msg.get('Received', '') or msg.get('message', '')
-                attachment = msg.get('attachment', '')
-                
-                # Format the message
-                content = f"From/To: {contact}\nDate: {date}\nService: {service}\n"
-                content += f"Direction: {direction}\n\n"
-                content += f"Message:\n{message}\n"
-                
-                if attachment:
-                    content += f"\nAttachment: {attachment}"
-                    
-                self.sms_message_display.insert(tk.END, content)
+        # The item id indexes the records the table was filled from, even if
+        # sms_data has since been replaced by a sort
+        records = self._shown_records.get("sms")
+        if selected_items and records:
+            msg = records[int(selected_items[0])]
+            
+            # Clear the text box
+            self.sms_message_display.delete("1.0", tk.END)
+            
+            # Add message details
+            direction = msg.get('direction', '')
+            contact = msg.get('phone_number', '')
+            date = msg.get('date', '')
+            service = msg.get('service', '')
+            message = msg.get('Sent', '') or msg.get('Received', '') or msg.get('message', '')
+            attachment = msg.get('attachment', '')
+            
+            # Format the message
+            content = (f"From/To: {contact}\nDate: {date}\nService: {service}\n"
+                       f"Direction: {direction}\n\n"
+                       f"Message:\n{message}\n")
+            if attachment:
+                content = f"{content}\nAttachment: {attachment}"
+                
+            self.sms_message_display.insert(tk.END, content)
 
     def is_backup_encrypted(self, backup_path):
         """Check if the selected backup is encrypted"""
@@ -2242,14 +2446,14 @@ class App(ctk.CTk):
             
             # If IsEncrypted key exists and is True, the backup is encrypted
             return manifest.get('IsEncrypted', False)
-        except:
+        except Exception:
             # If we can't read the file properly, assume it's encrypted
             return True
 
     def toggle_password_field(self, show=False):
         """Show or hide the password field and adjust other elements accordingly"""
         # First, ensure any existing timezone frame is completely removed
-        if hasattr(self, 'timezone_frame') and self.timezone_frame.winfo_exists():
+        if self.timezone_frame is not None and self.timezone_frame.winfo_exists():
             self.timezone_frame.destroy()
         
         if show:
@@ -2347,13 +2551,9 @@ class App(ctk.CTk):
         # For Windows/MacOS
         self.photo_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
-    def display_photos(self, photo_path):
-        """Display photos and videos in a responsive grid that adapts to window size"""
-        import time
-        from PIL import Image
-        from concurrent.futures import ThreadPoolExecutor
-        import platform
-        import os
+    def display_photos(self, photo_path, cache_dir=None):
+        """Display photos and videos in a responsive grid that adapts to window size,
+        keeping generated thumbnails in cache_dir across sessions when given"""
         
         # Clear existing content
         for widget in self.photo_thumbnails_tab.winfo_children():
@@ -2374,15 +2574,28 @@ class App(ctk.CTk):
         THUMB_SIZE = 150
         THUMB_SPACING = 20
         
+        # Thumbnail cache folder, if one was given and can be created
+        thumb_cache_dir = None
+        if cache_dir:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                thumb_cache_dir = cache_dir
+            except OSError as e:
+                print(f"Thumbnail cache disabled: {e}")
+        
         # Get photo AND video files
-        photo_files = [f for f in os.listdir(photo_path) 
-                    if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.heic', 
-                                        '.mp4', '.mov', '.m4v', '.3gp'))]
+        # scandir entries carry their file type, so no extra stat per file
+        with os.scandir(photo_path) as entries:
+            photo_files = [entry.name for entry in entries
+                           if entry.name.lower().endswith(_MEDIA_EXTENSIONS) and entry.is_file()]
         
         if not photo_files:
             status_label.configure(text="No media files found in this backup")
             return
         
+        # Lowercased extension of each file, looked up when its thumbnail loads
+        photo_exts = [os.path.splitext(name)[1].lower() for name in photo_files]
+        
         status_label.configure(text=f"Found {len(photo_files)} media files")
             
         # Create scrollable frame for content
@@ -2431,7 +2644,7 @@ class App(ctk.CTk):
         # Function to create/update the thumbnail grid
         def create_thumbnail_grid():
             """Create or update the grid of thumbnails"""
-            nonlocal current_columns
+            nonlocal current_columns, gallery_frame, loaded_count
             
             # Calculate optimal number of columns
             optimal_columns = calculate_columns()
@@ -2443,10 +2656,14 @@ class App(ctk.CTk):
             current_columns = optimal_columns
             status_label.configure(text=f"Arranging {len(photo_files)} photos ({current_columns} columns)")
             
-            # Clear existing thumbnails and reset loaded state
-            for widget in gallery_frame.winfo_children():
-                widget.destroy()
-            self.loaded_thumbnails = {}
+            # Clear existing thumbnails by swapping in a fresh frame (one destroy instead
+            # of one per thumbnail, and no stale column weights) and reset loaded state
+            if gallery_frame.winfo_children():
+                gallery_frame.destroy()
+                gallery_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
+                gallery_frame.pack(fill="both", expand=True)
+            self.loaded_thumbnails = bytearray(len(photo_files))
+            loaded_count = 0
             
             # Calculate total rows needed
             total_rows = (len(photo_files) + current_columns - 1) // current_columns
@@ -2533,8 +2750,9 @@ class App(ctk.CTk):
             # Load visible thumbnails after scrolling stops
             self.after(50, load_visible_thumbnails)
         
-        # Track loaded thumbnails
-        self.loaded_thumbnails = {}
+        # Track loaded thumbnails: one _THUMB_* state byte per file (0 = not requested)
+        self.loaded_thumbnails = bytearray(len(photo_files))
+        loaded_count = 0
         def create_fallback_thumbnail(self, image_path, size=(150, 150)):
             """Create a thumbnail using alternative methods when standard methods fail"""
             try:
@@ -2579,19 +2797,15 @@ class App(ctk.CTk):
                 visible_start = start_row * current_columns
                 visible_end = min(len(photo_files), end_row * current_columns)
                 
-                # Queue loading only for thumbnails that aren't already loaded or loading
-                batch_size = 2  # Process thumbnails in small batches
+                # Queue loading only for thumbnails that aren't already loaded or loading;
+                # the pool bounds the work and drain_thumbnails paces the UI updates
                 batch_count = 0
+                loaded = self.loaded_thumbnails
                 
                 for idx in range(visible_start, visible_end):
-                    if idx not in self.loaded_thumbnails and idx < len(photo_files):
-                        filename = photo_files[idx]
-                        self.loaded_thumbnails[idx] = "loading"
-                        
-                        # Stagger loading to prevent UI freezes (more delay for later items)
-                        batch_delay = (batch_count // batch_size) * 100
-                        self.after(batch_delay, lambda i=idx, f=filename: 
-                                self.executor.submit(load_thumbnail, i, f))
+                    if not loaded[idx]:
+                        loaded[idx] = _THUMB_LOADING
+                        submit_thumbnail(idx, photo_files[idx])
                         batch_count += 1
                         
                 # If we loaded thumbnails, update status
@@ -2621,33 +2835,86 @@ class App(ctk.CTk):
             self.photo_references = []
         self.photo_references.clear()
         
+        # Decoded thumbnails wait here until drain_thumbnails shows a batch of them
+        thumb_results = queue.Queue()
+        pending_thumbs = 0  # Submitted but not yet shown
+        drain_job = None
+        
+        def submit_thumbnail(index, filename):
+            """Queue a thumbnail for decoding and make sure results are being drained"""
+            nonlocal pending_thumbs, drain_job
+            pending_thumbs += 1
+            self._thumb_pool.submit(load_thumbnail, index, filename)
+            if drain_job is None:
+                drain_job = self.after(_THUMB_DRAIN_MS, drain_thumbnails)
+        
+        def drain_thumbnails():
+            """Show decoded thumbnails in one go, rescheduling while decodes are pending"""
+            nonlocal pending_thumbs, drain_job
+            for _ in range(_THUMB_DRAIN_MAX):
+                try:
+                    index, img, file_path, error = thumb_results.get_nowait()
+                except queue.Empty:
+                    break
+                pending_thumbs -= 1
+                if error is None:
+                    update_thumbnail(index, img, file_path)
+                else:
+                    update_thumbnail_error(index, error)
+            
+            if pending_thumbs:
+                drain_job = self.after(_THUMB_DRAIN_MS, drain_thumbnails)
+            else:
+                drain_job = None
+        
         # Function to load a thumbnail in the background
         def load_thumbnail(index, filename):
             """Load a thumbnail in a background thread"""
             try:
                 file_path = os.path.join(photo_path, filename)
-                file_ext = os.path.splitext(filename.lower())[1]
-                
-                # Create thumbnail based on file type
-                if file_ext == '.heic':
-                    img = self.create_heic_thumbnail(file_path, (THUMB_SIZE, THUMB_SIZE))
-                elif file_ext in ['.mp4', '.mov', '.m4v', '.3gp']:
-                    # Add video thumbnail generation
-                    img = self.create_video_thumbnail(file_path, (THUMB_SIZE, THUMB_SIZE))
-                else:
-                    img = Image.open(file_path)
-                    img.thumbnail((THUMB_SIZE, THUMB_SIZE))
+                file_ext = photo_exts[index]
+                
+                # Reuse the thumbnail from an earlier grid layout if the file is unchanged
+                stat = os.stat(file_path)
+                cache_key = (file_path, stat.st_mtime_ns, THUMB_SIZE)
+                img = self._thumb_cache.get(cache_key)
+                if img is None:
+                    # Then one saved by an earlier session
+                    cache_file = None
+                    if thumb_cache_dir:
+                        cache_file = _thumbnail_cache_file(thumb_cache_dir, file_path, stat, THUMB_SIZE)
+                        try:
+                            img = Image.open(cache_file)
+                            img.load()
+                        except (OSError, ValueError):
+                            img = None
+                    
+                    if img is None:
+                        # Create thumbnail based on file type
+                        decoder = getattr(self, _THUMBNAIL_DECODERS.get(file_ext, "create_image_thumbnail"))
+                        img = decoder(file_path, (THUMB_SIZE, THUMB_SIZE))
+                        
+                        # Placeholders are not saved, so a later session can retry the decode
+                        if cache_file and not img.info.get("generic"):
+                            _save_cached_thumbnail(img, cache_file)
+                    
+                    with self._thumb_cache_lock:
+                        if len(self._thumb_cache) >= _THUMB_CACHE_LIMIT:
+                            # Drop the oldest entry
+                            self._thumb_cache.pop(next(iter(self._thumb_cache)), None)
+                        self._thumb_cache[cache_key] = img
                 
                 # Update UI in main thread
-                self.after(0, lambda: update_thumbnail(index, img, file_path))
+                thumb_results.put((index, img, file_path, None))
                 
             except Exception as e:
                 print(f"Error loading thumbnail {filename}: {e}")
-                self.after(0, lambda: update_thumbnail_error(index, str(e)))
+                thumb_results.put((index, None, None, str(e)))
         
         # Function to update a thumbnail in the UI
         def update_thumbnail(index, img, file_path):
             """Update the UI with a loaded thumbnail"""
+            nonlocal loaded_count
             try:
                 row = index // current_columns
                 col = index % current_columns
@@ -2672,8 +2939,7 @@ class App(ctk.CTk):
                 img_label.pack(padx=5, pady=5)
                 
                 # Add video indicator if this is a video file
-                file_ext = os.path.splitext(file_path.lower())[1]
-                if file_ext in ['.mp4', '.mov', '.m4v', '.3gp']:
+                if photo_exts[index] in _VIDEO_EXTENSIONS:
                     video_indicator = ctk.CTkLabel(
                         thumb_frame,
                         text="▶ VIDEO",
@@ -2695,10 +2961,11 @@ class App(ctk.CTk):
                 name_label.bind("<Button-1>", lambda e: self.show_media_file(file_path))
                 
                 # Mark as loaded
-                self.loaded_thumbnails[index] = "loaded"
+                if self.loaded_thumbnails[index] != _THUMB_LOADED:
+                    self.loaded_thumbnails[index] = _THUMB_LOADED
+                    loaded_count += 1
                 
                 # Update status periodically
-                loaded_count = sum(1 for status in self.loaded_thumbnails.values() if status == "loaded")
                 if loaded_count % 10 == 0:
                     status_label.configure(text=f"Loaded {loaded_count}/{len(photo_files)} thumbnails")
                     
@@ -2747,27 +3014,30 @@ class App(ctk.CTk):
                 name_label.pack(pady=(0, 5))
                 
                 # Mark as error for tracking
-                self.loaded_thumbnails[index] = "error"
+                self.loaded_thumbnails[index] = _THUMB_ERROR
                 
             except Exception as e:
                 print(f"Error displaying thumbnail error: {e}")
         
-        # Create thread pool for thumbnail loading
-        self.executor = ThreadPoolExecutor(max_workers=8)
-        
         # Create initial thumbnail grid after a short delay
         self.after(100, create_thumbnail_grid)
         
         # Handle resize with debouncing
         def on_resize(event=None):
             """Handle window resize events with debouncing"""
+            # Ignore resizes that keep the column count, judged from the event's own
+            # width rather than querying Tk
+            if event is not None and event.width >= 50 and current_columns > 0:
+                columns = max(1, (event.width - 40) // (THUMB_SIZE + THUMB_SPACING))
+                if columns == current_columns:
+                    return
             if hasattr(self, '_resize_timer') and self._resize_timer:
                 self.after_cancel(self._resize_timer)
             self._resize_timer = self.after(300, create_thumbnail_grid)
         
-        # Bind resize events
+        # Bind resize events; scroll_frame fills the tab, so it sees every tab resize and
+        # its width is the one calculate_columns measures
         scroll_frame.bind("<Configure>", on_resize)
-        self.photo_thumbnails_tab.bind("<Configure>", on_resize)
 
     def extract_heic_exif(self, image_path):
         import exifread
@@ -2785,8 +3055,7 @@ class App(ctk.CTk):
         if not exif_data:
             return "No EXIF data found"
         
-        # Import for GPSTAGS
-        from PIL.ExifTags import TAGS, GPSTAGS
+        from PIL.ExifTags import TAGS
         
         # Helper function for rational conversion
         def rational_to_float(rational):
@@ -2814,7 +3083,7 @@ class App(ctk.CTk):
             gps_info = {}
             for tag, value in exif_data['GPSInfo'].items():
                 # Convert numeric tags to their text names if possible
-                tag_name = GPSTAGS.get(tag, tag) if isinstance(tag, int) else tag
+                tag_name = gps_tag(tag)
                 gps_info[tag_name] = value
             
             # Add to location data section
@@ -2876,26 +3145,15 @@ class App(ctk.CTk):
                 continue
                 
             # Process based on tag name
-            tag_name = tag
-            if isinstance(tag, int):
-                tag_name = TAGS.get(tag, tag)
+            tag_name = TAGS.get(tag, tag)
             
             # Skip MakerNote data (often large binary data)
-            tag_str = str(tag_name).lower()
-            if 'maker' in tag_str and 'note' in tag_str:
+            tag_lower = str(tag_name).lower()
+            if 'maker' in tag_lower and 'note' in tag_lower:
                 continue
             # Determine which section to put it in
-            section = "OTHER INFO"
-            tag_lower = str(tag_name).lower()
-            
-            if any(keyword in tag_lower for keyword in ['date', 'time', 'creation', 'modified']):
-                section = "BASIC INFO"
-            elif any(keyword in tag_lower for keyword in ['make', 'model', 'software', 'camera']):
-                section = "CAMERA INFO"
-            elif any(keyword in tag_lower for keyword in ['exposure', 'aperture', 'iso', 'focal', 'flash']):
-                section = "EXPOSURE INFO"
-            elif any(keyword in tag_lower for keyword in ['gps', 'location', 'altitude', 'longitude', 'latitude']):
-                section = "LOCATION DATA"
+            match = _EXIF_SECTION_RE.match(tag_lower)
+            section = _EXIF_SECTIONS[match.lastindex - 1][0] if match else "OTHER INFO"
             
             # Add to appropriate section
             sections[section].append(f"• {tag_name}: {value}")
@@ -3023,7 +3281,7 @@ class App(ctk.CTk):
         try:
             # Import required libraries
             from PIL import Image, ImageTk
-            from PIL.ExifTags import TAGS, GPSTAGS
+            from PIL.ExifTags import TAGS
             import json
             import webbrowser  # For opening URLs
             
@@ -3054,6 +3312,8 @@ class App(ctk.CTk):
             paned.paneconfigure(exif_frame, minsize=250)
             
             # Load and process the image
+            if image_path.lower().endswith((".heic", ".heif")):
+                _register_heif_opener()
             img = Image.open(image_path)
             
             # Calculate display size
@@ -3210,9 +3470,8 @@ class App(ctk.CTk):
                         gps_info = {}
                         
                         # Process all GPS tags
-                        for gps_tag in gps:
-                            gps_decoded = GPSTAGS.get(gps_tag, gps_tag)
-                            gps_info[gps_decoded] = gps[gps_tag]
+                        for tag in gps:
+                            gps_info[gps_tag(tag)] = gps[tag]
                         
                         # Helper function for rational values
                         def rational_to_float(rational):
@@ -3443,6 +3702,7 @@ class App(ctk.CTk):
 
         self.interactions_search_entry = ctk.CTkEntry(search_frame, width=250)
         self.interactions_search_entry.pack(side="left", padx=5, pady=5, fill="x", expand=True)
+        self._bind_search(self.interactions_search_entry, self.filter_interactions_results)
 
         # Add search/clear buttons
         search_button = ctk.CTkButton(
@@ -3505,18 +3765,27 @@ class App(ctk.CTk):
 
     def filter_interactions_results(self, search_term):
         """Filter interactions based on search term."""
-        # Clear the table
-        for item in self.interactions_tree.get_children():
-            self.interactions_tree.delete(item)
+        if not hasattr(self, 'interactions_tree'):
+            return  # Tab not built yet; it is filled when first opened
+        if self._filter_unchanged("interactions", search_term):
+            return  # Already showing this search
         
-        if hasattr(self, 'interactions_data') and self.interactions_data:
+        self._filter_in_background("interactions", lambda: self._compute_interaction_rows(search_term))
+
+    def _compute_interaction_rows(self, search_term):
+        """Return (text, values, tags) for each interaction matching search_term"""
+        rows = []
+        
+        if self.interactions_data:
             search_term = search_term.lower()
             
-            for i, interaction in enumerate(self.interactions_data):
+            matches = self._search_matches("interactions", search_term)
+            
+            for i in matches:
+                interaction = self.interactions_data[i]
+                
                 # Handle dictionary or tuple
                 if isinstance(interaction, dict):
-                    row_str = " ".join(str(interaction.get(k, "")).lower() for k in interaction.keys())
-                    
                     # Get date values
                     event_start = interaction.get('Event Start', '')
                     event_end = interaction.get('Event End', '')
@@ -3534,9 +3803,6 @@ class App(ctk.CTk):
                     domain = interaction.get('Domain', '')
                 else:
                     # Assume it's a tuple
-                    str_values = [str(val).lower() for val in interaction]
-                    row_str = " ".join(str_values)
-                    
                     # Map tuple values to appropriate fields - adjust indices as needed
                     event_start = interaction[0] if len(interaction) > 0 else ''
                     event_end = interaction[1] if len(interaction) > 1 else ''
@@ -3553,25 +3819,37 @@ class App(ctk.CTk):
                     recipient_id = interaction[7] if len(interaction) > 7 else ''
                     domain = interaction[8] if len(interaction) > 8 else ''
                 
-                if search_term in row_str:
-                    item_id = self.interactions_tree.insert(
-                        "", "end", text=i,
-                        values=(
-                            event_start_display,  # Now timezone-adjusted
-                            event_end_display,    # Now timezone-adjusted
-                            app_val, direction, sender, sender_id, recipient, recipient_id, domain
-                        )
-                    )
-                    
-                    # Apply color based on direction
-                    direction_lower = str(direction).lower()
-                    if 'incoming' in direction_lower:
-                        self.interactions_tree.item(item_id, tags=('incoming',))
-                    elif 'outgoing' in direction_lower:
-                        self.interactions_tree.item(item_id, tags=('outgoing',))
+                values = (
+                    event_start_display,  # Now timezone-adjusted
+                    event_end_display,    # Now timezone-adjusted
+                    app_val, direction, sender, sender_id, recipient, recipient_id, domain
+                )
+                
+                # Apply color based on direction
+                direction_lower = str(direction).lower()
+                if 'incoming' in direction_lower:
+                    tags = ('incoming',)
+                elif 'outgoing' in direction_lower:
+                    tags = ('outgoing',)
+                else:
+                    tags = ()
+                rows.append((i, values, tags))
+        
+        return rows
 
     def create_video_thumbnail(self, video_path, size=(150, 150)):
         """Generate thumbnail from the first frame of a video"""
+        try:
+            # Prefer PyAV, which decodes without holding the GIL so thumbnail workers overlap
+            import av
+            with av.open(video_path) as container:
+                img = next(container.decode(video=0)).to_image()
+            img.thumbnail(size)
+            return img
+        except Exception:
+            # PyAV is not installed or can't decode this file; let OpenCV try
+            pass
+        
         try:
             # Try to use OpenCV if available
             import cv2
@@ -3592,14 +3870,28 @@ class App(ctk.CTk):
             # Fallback if OpenCV is not available
             return self.create_generic_thumbnail("Video", size)
 
+    def create_image_thumbnail(self, image_path, size=(150, 150)):
+        """Generate thumbnail from a still image, preferring an embedded JPEG preview"""
+        img = Image.open(image_path)
+        # Phone JPEGs usually embed a preview that saves decoding the photo
+        if img.format == "JPEG":
+            preview = _embedded_jpeg_thumbnail(img, size)
+            if preview is not None:
+                return preview
+        img.thumbnail(size)
+        return img
+
     def create_heic_thumbnail(self, heic_path, size=(150, 150)):
         """Generate thumbnail from HEIC file"""
         try:
-            # Try to use pillow-heif if available
-            from pillow_heif import register_heif_opener
-            register_heif_opener()
+            # Registers the pillow-heif opener the first time a HEIC is opened
+            _register_heif_opener()
+            
+            # Prefer the thumbnail stored in the file over decoding the full image
+            preview = _embedded_heic_thumbnail(heic_path, size)
+            if preview is not None:
+                return preview
             
-            # Now PIL should be able to open HEIC files
             img = Image.open(heic_path)
             img.thumbnail(size)
             return img
@@ -3628,6 +3920,7 @@ class App(ctk.CTk):
         
         # Draw text in white
         draw.text(position, text, fill=(255, 255, 255), font=font)
+        img.info["generic"] = True  # Placeholder, not a decoded thumbnail
         return img
 
     def show_media_file(self, path):
@@ -3637,12 +3930,7 @@ class App(ctk.CTk):
         if file_ext in ['.mp4', '.mov', '.m4v', '.3gp']:
             # For videos, use system default player    
             try:
-                if platform.system() == 'Darwin':  # macOS
-                    subprocess.run(['open', path])
-                elif platform.system() == 'Windows':
-                    os.startfile(path)
-                else:  # Linux
-                    subprocess.run(['xdg-open', path])
+                _open_with_system(path)
             except Exception as e:
                 messagebox.showerror("Error", f"Could not open video file: {str(e)}")
         else:
@@ -3656,28 +3944,22 @@ class App(ctk.CTk):
         # Check if it's a HEIC/HEIF file
         if image_path.lower().endswith(('.heic', '.heif')):
             try:
-                # Method 1: Use pyheif library
-                import pyheif
-                
-                heif_file = pyheif.read(image_path)
-                # Extract metadata
-                for metadata in heif_file.metadata or []:
-                    if metadata['type'] == 'Exif':
-                        # Skip the TIFF header (first 8 bytes)
-                        import io
-                        from PIL import Image
-                        from PIL.ExifTags import TAGS
-                        
-                        exif_stream = io.BytesIO(metadata['data'][8:])
-                        exif_info = Image.Exif()
-                        exif_info.load(exif_stream)
-                        
-                        # Convert to dictionary
-                        for tag_id, value in exif_info.items():
-                            tag = TAGS.get(tag_id, tag_id)
-                            exif_data[tag] = value
-                        
-                        return exif_data
+                # Method 1: Read the EXIF block with pillow-heif without decoding any pixels
+                import pillow_heif
+                from PIL.ExifTags import TAGS
+                
+                heif_file = pillow_heif.open_heif(image_path, convert_hdr_to_8bit=False)
+                exif_bytes = heif_file.info.get('exif')
+                if exif_bytes:
+                    exif_info = Image.Exif()
+                    exif_info.load(exif_bytes)
+                    
+                    # Convert to dictionary
+                    for tag_id, value in exif_info.items():
+                        tag = TAGS.get(tag_id, tag_id)
+                        exif_data[tag] = value
+                    
+                    return exif_data
                         
             except (ImportError, Exception) as e:
                 # Method 2: Use exiftool as fallback